@@ -16,21 +16,169 @@ The interpreter produces:
 
 from __future__ import annotations
 
+import functools
+import io
 import os
 import re
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Mapping
 
 from models.skills.sexpr_generator import SExprGenerator, SExprParser
 
+try:
+    # Optional: C-backed HTML parsing avoids regex backtracking on
+    # malformed markup. The regex path below remains the fallback.
+    from selectolax.parser import HTMLParser as _HTMLParser
+except ImportError:
+    _HTMLParser = None
+
+
+# =============================================================================
+# Precompiled Patterns
+# =============================================================================
+
+# UI element extraction (HEEx/HTML). The four element kinds are fused into a
+# single alternation so the source buffer is scanned once instead of four times;
+# named groups identify which alternative matched.
+_UI_RE = re.compile(
+    r'(?P<input><input[^>]*id="(?P<iid>[^"]+)"[^>]*type="(?P<itype>\w+)"[^>]*(?:phx-\w+="(?P<iphx>[^"]+)")?)'
+    r'|(?P<display><(?:span|p|div)[^>]*id="(?P<did>[^"]+)"[^>]*class="[^"]*font-mono[^"]*")'
+    r'|(?P<section><div[^>]*id="(?P<sid>[^"]+)"[^>]*class="[^"]*(?:bg-white|rounded-xl)[^"]*")'
+    r'|(?P<button><button[^>]*id="(?P<bid>[^"]+)"[^>]*phx-click="(?P<bphx>[^"]+)")'
+)
+
+# Known page sections, in canonical page order: section_id -> title
+_SECTION_TITLES = {
+    "project-scope": "Project Scope",
+    "activities-table": "Activities & Responsibilities",
+    "component-calculator": "Component Scaling Calculator",
+    "effort-breakdown": "Effort Breakdown",
+    "proposed-buffers": "Proposed Buffers",
+    "team-composition": "Team Composition",
+}
+
+# All six section-id literals found in a single scan of the source
+_SECTION_SCAN_RE = re.compile(
+    r'id="(' + '|'.join(map(re.escape, _SECTION_TITLES)) + r')"'
+)
+
+# Section-id -> skill definition, built once at import. The proxy makes
+# the shared mapping read-only since interpreters cache it across calls.
+_SECTION_SKILL_MAP: Mapping[str, dict[str, Any]] = MappingProxyType({
+    "project-scope": {
+        "id": ":project-scope",
+        "name": "Project Scope",
+        "description": "Input file counts and compute totals/breakdowns",
+        "inputs": [":file-counts"],
+        "outputs": [":total-files", ":component-breakdown"],
+        "state": {"simple": 0, "medium": 0, "complex": 0},
+        "compute": "(emit :total-files (sum (get input :file-counts)))",
+    },
+    "activities-table": {
+        "id": ":activity-calculator",
+        "name": "Activity Calculator",
+        "description": "Track activities with team assignments and compute totals",
+        "inputs": [":activity-update", ":team-assignment"],
+        "outputs": [":activity-totals", ":team-effort"],
+        "state": {"activities": {}},
+        "compute": "(emit :activity-totals (sum-values (get state :activities)))",
+    },
+    "component-calculator": {
+        "id": ":component-calculator",
+        "name": "Component Calculator",
+        "description": "Scale file counts by complexity multipliers",
+        "inputs": [":file-count", ":breakdown", ":automation-pct"],
+        "outputs": [":scaled-effort", ":component-days"],
+        "state": {"base-hours-per-file": 15},
+        "compute": "(emit :scaled-effort (* (get input :file-count) (get state :base-hours-per-file)))",
+    },
+    "effort-breakdown": {
+        "id": ":effort-aggregator",
+        "name": "Effort Aggregator",
+        "description": "Aggregate all effort sources into total days",
+        "inputs": [":component-effort", ":activity-effort", ":buffer-days"],
+        "outputs": [":total-days", ":effort-breakdown"],
+        "state": {"component": 0, "activity": 0, "buffer": 0},
+        "compute": "(emit :total-days (+ (get input :component-effort) (get input :activity-effort) (get input :buffer-days)))",
+    },
+    "proposed-buffers": {
+        "id": ":buffer-calculator",
+        "name": "Buffer Calculator",
+        "description": "Compute project buffers as percentage of base days",
+        "inputs": [":base-days", ":buffer-config"],
+        "outputs": [":buffer-days", ":buffer-breakdown"],
+        "state": {"leave-pct": 10, "dependency-pct": 15, "learning-pct": 20},
+        "compute": "(emit :buffer-days (+ (* (get input :base-days) 0.1) (* (get input :base-days) 0.15) (* (get input :base-days) 0.2)))",
+    },
+    "team-composition": {
+        "id": ":team-manager",
+        "name": "Team Composition",
+        "description": "Track team member allocation across skills",
+        "inputs": [":team-update"],
+        "outputs": [":team-totals"],
+        "state": {"automation": 0, "testing": 0, "total": 0},
+        "compute": "(emit :team-totals (get state))",
+    },
+})
+
+# Elixir skill module extraction. The combined pattern grabs all four
+# fields in one scan when the callbacks appear in the conventional order;
+# the per-field patterns remain as a fallback for out-of-order modules.
+_ELIXIR_SKILL_RE = re.compile(
+    r'def skill_id.*?do\s*:(?P<id>\w+)'
+    r'.*?def input_channels.*?do\s*\[(?P<inputs>[^\]]*)\]'
+    r'.*?def output_channels.*?do\s*\[(?P<outputs>[^\]]*)\]'
+    r'.*?def initial_state.*?%\{(?P<state>[^}]*)\}',
+    re.DOTALL,
+)
+_ELIXIR_ID_RE = re.compile(r'def skill_id.*?do\s*:(\w+)', re.DOTALL)
+_ELIXIR_INPUTS_RE = re.compile(r'def input_channels.*?do\s*\[([^\]]*)\]', re.DOTALL)
+_ELIXIR_OUTPUTS_RE = re.compile(r'def output_channels.*?do\s*\[([^\]]*)\]', re.DOTALL)
+_ELIXIR_STATE_RE = re.compile(r'def initial_state.*?%\{([^}]*)\}', re.DOTALL)
+_STATE_PAIR_RE = re.compile(r'(\w+):\s*([^,}]+)')
+
+# SkillManager wiring extraction
+_WIRING_RE = re.compile(r'\{:(\w+),\s*:(\w+)\}\s*=>\s*\[(.*?)\]', re.DOTALL)
+_WIRING_TARGET_RE = re.compile(r'\{:(\w+),\s*:(\w+)\}')
+
+# Translation tables for Elixir snake_case -> DSL kebab-case / title words.
+# str.translate on a single-char table is one C loop, cheaper than replace.
+_U2D = str.maketrans('_', '-')
+_U2SPACE = str.maketrans('_', ' ')
+
+
+def _starts_with_lt(s: str) -> bool:
+    """True if the first non-whitespace character is '<'.
+
+    Bounded scan instead of s.strip().startswith('<'), which would copy
+    the whole buffer just to inspect its first character.
+    """
+    for ch in s:
+        if ch.isspace():
+            continue
+        return ch == '<'
+    return False
+
+
+@functools.lru_cache(maxsize=64)
+def _read_source_cached(path: str, mtime_ns: int, size: int) -> str:
+    """Read a source file, memoized by (path, mtime, size).
+
+    The mtime/size key invalidates the cache entry automatically when the
+    file changes on disk, so repeated pipeline runs skip redundant I/O.
+    """
+    return Path(path).read_text()
+
 
 # =============================================================================
 # UI Element Extraction
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class UIElement:
     """An interactive UI element extracted from the page."""
 
@@ -43,7 +191,7 @@ class UIElement:
     label: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class PageSection:
     """A section of the page (e.g., Project Scope, Activities)."""
 
@@ -76,6 +224,9 @@ class LocalhostInterpreter:
     def __init__(self):
         self.generator = SExprGenerator()
         self.parser = SExprParser()
+        # Memoized interpret_from_source results, keyed by the (path, mtime)
+        # fingerprint of every source file that feeds the pipeline.
+        self._skill_cache: dict[tuple, list[dict[str, Any]]] = {}
 
     def interpret_from_source(self) -> list[dict[str, Any]]:
         """Interpret skills directly from Elixir source files.
@@ -83,7 +234,36 @@ class LocalhostInterpreter:
         This is the primary method when localhost:4000 is not running.
         It reads the LiveView and skill module source to extract
         skill definitions, UI elements, and wiring.
+
+        Results are memoized per (path, mtime) fingerprint of the source
+        files, so repeated calls (e.g. from generate_full_dsl) only
+        re-interpret when a file actually changed.
         """
+        project_live_path = (
+            self.PROJECT_ROOT / "lib" / "neo_excel_ppt_web" / "live" / "project_live.ex"
+        )
+        skill_dir = self.PROJECT_ROOT / "lib" / "neo_excel_ppt" / "skills"
+
+        # scandir gives us name + stat per entry without the extra syscalls
+        # Path.glob would issue; entries are (path, stem, mtime_ns).
+        skill_entries: list[tuple[str, str, int]] = []
+        if skill_dir.exists():
+            with os.scandir(skill_dir) as it:
+                skill_entries = sorted(
+                    (entry.path, entry.name[:-3], entry.stat().st_mtime_ns)
+                    for entry in it
+                    if entry.name.endswith("_skill.ex")
+                )
+
+        key_parts: list[tuple[str, int]] = []
+        if project_live_path.exists():
+            key_parts.append((str(project_live_path), project_live_path.stat().st_mtime_ns))
+        key_parts.extend((path, mtime) for path, _, mtime in skill_entries)
+        cache_key = tuple(key_parts)
+        cached = self._skill_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         skills: list[dict[str, Any]] = []
 
         # Extract from project_live.ex
@@ -95,15 +275,19 @@ class LocalhostInterpreter:
                 if skill:
                     skills.append(skill)
 
-        # Extract from individual skill modules
-        skill_dir = self.PROJECT_ROOT / "lib" / "neo_excel_ppt" / "skills"
-        if skill_dir.exists():
-            for skill_file in skill_dir.glob("*_skill.ex"):
-                source = skill_file.read_text()
-                skill = self._elixir_skill_to_definition(source, skill_file.stem)
+        # Extract from individual skill modules; reads overlap in a small
+        # thread pool so the per-file I/O latency is not serialized.
+        if skill_entries:
+            with ThreadPoolExecutor(max_workers=min(8, len(skill_entries))) as pool:
+                sources = list(
+                    pool.map(lambda entry: Path(entry[0]).read_text(), skill_entries)
+                )
+            for (_, stem, _), source in zip(skill_entries, sources):
+                skill = self._elixir_skill_to_definition(source, stem)
                 if skill:
                     skills.append(skill)
 
+        self._skill_cache[cache_key] = skills
         return skills
 
     def interpret_from_html(self, source_or_path: str) -> list[dict[str, Any]]:
@@ -113,8 +297,13 @@ class LocalhostInterpreter:
             source_or_path: Either raw HTML/HEEx content, or a relative
                            path to a source file in the project.
         """
-        # If it looks like a file path, read it
-        if not source_or_path.strip().startswith('<') and '/' in source_or_path:
+        # If it looks like a file path, read it. Obvious HTML (leading '<')
+        # and buffers too large to be a path skip the filesystem probe.
+        if (
+            not _starts_with_lt(source_or_path)
+            and len(source_or_path) < 4096
+            and '/' in source_or_path
+        ):
             full_path = self.PROJECT_ROOT / source_or_path
             if full_path.exists():
                 source_or_path = full_path.read_text()
@@ -125,53 +314,89 @@ class LocalhostInterpreter:
         return [self._section_to_skill(s) for s in sections if s]
 
     def extract_ui_elements(self, source: str) -> list[UIElement]:
-        """Extract all interactive UI elements from source."""
+        """Extract all interactive UI elements from source.
+
+        Uses selectolax's linear-time HTML parser when available and
+        falls back to the fused regex scan otherwise.
+        """
+        if _HTMLParser is not None:
+            return self._extract_ui_elements_dom(source)
+
         elements: list[UIElement] = []
 
-        # Find input elements with IDs
-        for m in re.finditer(
-            r'<input[^>]*id="([^"]+)"[^>]*type="(\w+)"[^>]*(?:phx-\w+="([^"]+)")?',
-            source,
-        ):
+        for m in _UI_RE.finditer(source):
+            if m.group("input") is not None:
+                elements.append(UIElement(
+                    element_id=m.group("iid"),
+                    element_type="input",
+                    html_type=m.group("itype"),
+                    phx_event=m.group("iphx"),
+                ))
+            elif m.group("display") is not None:
+                elements.append(UIElement(
+                    element_id=m.group("did"),
+                    element_type="display",
+                    html_type="span",
+                ))
+            elif m.group("section") is not None:
+                elements.append(UIElement(
+                    element_id=m.group("sid"),
+                    element_type="section",
+                    html_type="div",
+                ))
+            else:
+                elements.append(UIElement(
+                    element_id=m.group("bid"),
+                    element_type="button",
+                    html_type="button",
+                    phx_event=m.group("bphx"),
+                ))
+
+        return elements
+
+    def _extract_ui_elements_dom(self, source: str) -> list[UIElement]:
+        """DOM-based element extraction via selectolax CSS queries."""
+        tree = _HTMLParser(source)
+        elements: list[UIElement] = []
+
+        for node in tree.css('input[id][type]'):
+            attrs = node.attributes
+            phx_event = next(
+                (v for k, v in attrs.items() if k.startswith("phx-") and v),
+                None,
+            )
             elements.append(UIElement(
-                element_id=m.group(1),
+                element_id=attrs["id"],
                 element_type="input",
-                html_type=m.group(2),
-                phx_event=m.group(3),
+                html_type=attrs.get("type") or "",
+                phx_event=phx_event,
             ))
 
-        # Find display elements with IDs (spans, divs with data bindings)
-        for m in re.finditer(
-            r'<(?:span|p|div)[^>]*id="([^"]+)"[^>]*class="[^"]*font-mono[^"]*"',
-            source,
+        for node in tree.css(
+            'span[id][class*="font-mono"], p[id][class*="font-mono"], '
+            'div[id][class*="font-mono"]'
         ):
             elements.append(UIElement(
-                element_id=m.group(1),
+                element_id=node.attributes["id"],
                 element_type="display",
                 html_type="span",
             ))
 
-        # Find sections with IDs
-        for m in re.finditer(
-            r'<div[^>]*id="([^"]+)"[^>]*class="[^"]*(?:bg-white|rounded-xl)[^"]*"',
-            source,
+        for node in tree.css(
+            'div[id][class*="bg-white"], div[id][class*="rounded-xl"]'
         ):
             elements.append(UIElement(
-                element_id=m.group(1),
+                element_id=node.attributes["id"],
                 element_type="section",
                 html_type="div",
             ))
 
-        # Find buttons with IDs and phx-click events
-        for m in re.finditer(
-            r'<button[^>]*id="([^"]+)"[^>]*phx-click="([^"]+)"',
-            source,
-        ):
+        for node in tree.css('button[id][phx-click]'):
             elements.append(UIElement(
-                element_id=m.group(1),
+                element_id=node.attributes["id"],
                 element_type="button",
                 html_type="button",
-                phx_event=m.group(2),
+                phx_event=node.attributes.get("phx-click"),
             ))
 
         return elements
@@ -197,173 +422,115 @@ class LocalhostInterpreter:
         return self.generator.generate_wiring(connections)
 
     def generate_full_dsl(self) -> str:
-        """Generate the complete DSL (all skills + wiring)."""
-        parts = [
-            ";; NeoExcelPPT Skills DSL",
-            ";; Auto-generated from localhost:4000 source analysis",
-            "",
-        ]
+        """Generate the complete DSL (all skills + wiring).
+
+        Skills are written straight into one growing buffer rather than
+        generated as per-skill strings that get rejoined.
+        """
+        sio = io.StringIO()
+        sio.write(";; NeoExcelPPT Skills DSL\n")
+        sio.write(";; Auto-generated from localhost:4000 source analysis\n\n")
 
         # Add all skill definitions
-        for sexpr in self.generate_skill_sexprs():
-            parts.append(sexpr)
-            parts.append("")
+        for skill in self.interpret_from_source():
+            if skill:
+                self.generator._write_skill(sio, skill)
+                sio.write("\n\n")
 
         # Add wiring
-        parts.append(";; Skill Wiring")
-        parts.append(self.generate_wiring_sexpr())
+        sio.write(";; Skill Wiring\n")
+        sio.write(self.generate_wiring_sexpr())
 
-        return "\n".join(parts)
+        return sio.getvalue()
 
     # =========================================================================
     # Private Helpers
     # =========================================================================
 
     def _read_source(self, relative_path: str) -> str | None:
-        """Read a source file from the project."""
+        """Read a source file from the project (memoized by mtime/size)."""
         full_path = self.PROJECT_ROOT / relative_path
-        if full_path.exists():
-            return full_path.read_text()
-        return None
+        try:
+            st = full_path.stat()
+        except OSError:
+            return None
+        return _read_source_cached(str(full_path), st.st_mtime_ns, st.st_size)
 
     def _extract_sections(self, source: str) -> list[PageSection]:
         """Extract page sections from HEEx/HTML source."""
         sections: list[PageSection] = []
 
-        # Match section components in the render function
-        section_patterns = [
-            (r'id="project-scope"', "Project Scope", "project-scope"),
-            (r'id="activities-table"', "Activities & Responsibilities", "activities-table"),
-            (r'id="component-calculator"', "Component Scaling Calculator", "component-calculator"),
-            (r'id="effort-breakdown"', "Effort Breakdown", "effort-breakdown"),
-            (r'id="proposed-buffers"', "Proposed Buffers", "proposed-buffers"),
-            (r'id="team-composition"', "Team Composition", "team-composition"),
-        ]
-
-        for pattern, title, section_id in section_patterns:
-            if re.search(pattern, source):
-                section = PageSection(
+        # One scan finds every known section id; emit in canonical order
+        present = {m.group(1) for m in _SECTION_SCAN_RE.finditer(source)}
+        if not present:
+            return sections
+
+        # Extract the UI elements once and bucket them by section prefix
+        # instead of rescanning the source per section.
+        by_section: dict[str, list[UIElement]] = {sid: [] for sid in present}
+        for element in self.extract_ui_elements(source):
+            for section_id in present:
+                if element.element_id.startswith(section_id):
+                    by_section[section_id].append(element)
+                    break
+
+        for section_id, title in _SECTION_TITLES.items():
+            if section_id in present:
+                sections.append(PageSection(
                     section_id=section_id,
                     title=title,
-                )
-                # Extract elements within this section
-                section.elements = self._extract_section_elements(
-                    source, section_id
-                )
-                sections.append(section)
+                    elements=by_section[section_id],
+                ))
 
         return sections
 
-    def _extract_section_elements(
-        self, source: str, section_id: str
-    ) -> list[UIElement]:
-        """Extract UI elements that belong to a specific section."""
-        elements = self.extract_ui_elements(source)
-        return [e for e in elements if e.element_id.startswith(section_id)]
-
     def _section_to_skill(self, section: PageSection) -> dict[str, Any] | None:
         """Convert a page section into a skill definition."""
-        # Map section IDs to skill configurations
-        section_skill_map: dict[str, dict[str, Any]] = {
-            "project-scope": {
-                "id": ":project-scope",
-                "name": "Project Scope",
-                "description": "Input file counts and compute totals/breakdowns",
-                "inputs": [":file-counts"],
-                "outputs": [":total-files", ":component-breakdown"],
-                "state": {"simple": 0, "medium": 0, "complex": 0},
-                "compute": "(emit :total-files (sum (get input :file-counts)))",
-            },
-            "activities-table": {
-                "id": ":activity-calculator",
-                "name": "Activity Calculator",
-                "description": "Track activities with team assignments and compute totals",
-                "inputs": [":activity-update", ":team-assignment"],
-                "outputs": [":activity-totals", ":team-effort"],
-                "state": {"activities": {}},
-                "compute": "(emit :activity-totals (sum-values (get state :activities)))",
-            },
-            "component-calculator": {
-                "id": ":component-calculator",
-                "name": "Component Calculator",
-                "description": "Scale file counts by complexity multipliers",
-                "inputs": [":file-count", ":breakdown", ":automation-pct"],
-                "outputs": [":scaled-effort", ":component-days"],
-                "state": {"base-hours-per-file": 15},
-                "compute": "(emit :scaled-effort (* (get input :file-count) (get state :base-hours-per-file)))",
-            },
-            "effort-breakdown": {
-                "id": ":effort-aggregator",
-                "name": "Effort Aggregator",
-                "description": "Aggregate all effort sources into total days",
-                "inputs": [":component-effort", ":activity-effort", ":buffer-days"],
-                "outputs": [":total-days", ":effort-breakdown"],
-                "state": {"component": 0, "activity": 0, "buffer": 0},
-                "compute": "(emit :total-days (+ (get input :component-effort) (get input :activity-effort) (get input :buffer-days)))",
-            },
-            "proposed-buffers": {
-                "id": ":buffer-calculator",
-                "name": "Buffer Calculator",
-                "description": "Compute project buffers as percentage of base days",
-                "inputs": [":base-days", ":buffer-config"],
-                "outputs": [":buffer-days", ":buffer-breakdown"],
-                "state": {"leave-pct": 10, "dependency-pct": 15, "learning-pct": 20},
-                "compute": "(emit :buffer-days (+ (* (get input :base-days) 0.1) (* (get input :base-days) 0.15) (* (get input :base-days) 0.2)))",
-            },
-            "team-composition": {
-                "id": ":team-manager",
-                "name": "Team Composition",
-                "description": "Track team member allocation across skills",
-                "inputs": [":team-update"],
-                "outputs": [":team-totals"],
-                "state": {"automation": 0, "testing": 0, "total": 0},
-                "compute": "(emit :team-totals (get state))",
-            },
-        }
-
-        return section_skill_map.get(section.section_id)
+        return _SECTION_SKILL_MAP.get(section.section_id)
 
     def _elixir_skill_to_definition(
         self, source: str, module_name: str
     ) -> dict[str, Any] | None:
         """Extract a skill definition from an Elixir skill module."""
-        # Extract skill_id
-        id_match = re.search(r'def skill_id.*?do\s*:(\w+)', source, re.DOTALL)
-        if not id_match:
-            return None
-        skill_id = id_match.group(1)
+        # Fast path: all four fields in one scan (conventional callback order)
+        combined = _ELIXIR_SKILL_RE.search(source)
+        if combined:
+            skill_id = combined.group("id")
+            inputs_raw = combined.group("inputs")
+            outputs_raw = combined.group("outputs")
+            state_raw = combined.group("state")
+        else:
+            # Fallback: per-field searches for out-of-order modules
+            id_match = _ELIXIR_ID_RE.search(source)
+            if not id_match:
+                return None
+            skill_id = id_match.group(1)
+            inputs_match = _ELIXIR_INPUTS_RE.search(source)
+            inputs_raw = inputs_match.group(1) if inputs_match else None
+            outputs_match = _ELIXIR_OUTPUTS_RE.search(source)
+            outputs_raw = outputs_match.group(1) if outputs_match else None
+            state_match = _ELIXIR_STATE_RE.search(source)
+            state_raw = state_match.group(1) if state_match else None
 
-        # Extract input_channels
-        inputs_match = re.search(
-            r'def input_channels.*?do\s*\[([^\]]*)\]', source, re.DOTALL
-        )
         inputs = []
-        if inputs_match:
+        if inputs_raw:
             inputs = [
                 f":{ch.strip().strip(':')}"
-                for ch in inputs_match.group(1).split(',')
+                for ch in inputs_raw.split(',')
                 if ch.strip()
             ]
 
-        # Extract output_channels
-        outputs_match = re.search(
-            r'def output_channels.*?do\s*\[([^\]]*)\]', source, re.DOTALL
-        )
         outputs = []
-        if outputs_match:
+        if outputs_raw:
             outputs = [
                 f":{ch.strip().strip(':')}"
-                for ch in outputs_match.group(1).split(',')
+                for ch in outputs_raw.split(',')
                 if ch.strip()
             ]
 
-        # Extract initial_state keys
-        state_match = re.search(
-            r'def initial_state.*?%\{([^}]*)\}', source, re.DOTALL
-        )
         state = {}
-        if state_match:
-            for pair in re.finditer(r'(\w+):\s*([^,}]+)', state_match.group(1)):
+        if state_raw:
+            for pair in _STATE_PAIR_RE.finditer(state_raw):
                 key = pair.group(1)
                 val = pair.group(2).strip()
                 try:
@@ -375,8 +542,8 @@ class LocalhostInterpreter:
                         state[key] = val
 
         return {
-            "id": f":{skill_id.replace('_', '-')}",
-            "name": module_name.replace('_skill', '').replace('_', ' ').title(),
+            "id": f":{skill_id.translate(_U2D)}",
+            "name": module_name.replace('_skill', '').translate(_U2SPACE).title(),
             "description": f"Skill extracted from {module_name}.ex",
             "inputs": inputs,
             "outputs": outputs,
@@ -390,21 +557,17 @@ class LocalhostInterpreter:
         connections: list[dict[str, str]] = []
 
         # Match patterns like {:project_scope, :total_files} => [{:component_calculator, :file_count}]
-        for m in re.finditer(
-            r'\{:(\w+),\s*:(\w+)\}\s*=>\s*\[(.*?)\]',
-            source,
-            re.DOTALL,
-        ):
-            from_skill = m.group(1).replace('_', '-')
-            from_channel = m.group(2).replace('_', '-')
+        for m in _WIRING_RE.finditer(source):
+            from_skill = m.group(1).translate(_U2D)
+            from_channel = m.group(2).translate(_U2D)
 
-            # Parse targets
-            for target in re.finditer(r'\{:(\w+),\s*:(\w+)\}', m.group(3)):
+            # findall returns plain tuples from C without Match objects
+            for to_skill, to_channel in _WIRING_TARGET_RE.findall(m.group(3)):
                 connections.append({
                     "from_skill": from_skill,
                     "from_channel": from_channel,
-                    "to_skill": target.group(1).replace('_', '-'),
-                    "to_channel": target.group(2).replace('_', '-'),
+                    "to_skill": to_skill.translate(_U2D),
+                    "to_channel": to_channel.translate(_U2D),
                 })
 
         return connections
@@ -11,15 +11,54 @@ This module provides:
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
+import operator
+import os
+import pickle
 import re
+import sys
+from collections import ChainMap
+from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple
+
+try:
+    import numba as _numba  # optional JIT backend for numeric kernels
+except ImportError:
+    _numba = None
+
+try:
+    import numpy as _np  # optional vectorized backend for large reductions
+except ImportError:
+    _np = None
 
 
 # =============================================================================
 # S-Expression Parser (with curly-brace map support)
 # =============================================================================
 
+# Interned structural atoms: comparisons against these in ast_to_skill and
+# the define-skill check hit the interned-pointer fast path.
+_DEFINE_SKILL = sys.intern("define-skill")
+_INPUTS = sys.intern("inputs")
+_OUTPUTS = sys.intern("outputs")
+_STATE = sys.intern("state")
+_COMPUTE = sys.intern("compute")
+
+# One alternation covering every token class, so tokenizing is a single
+# traversal inside the C regex engine rather than a Python char loop.
+# Group order matters: comments before atoms so ';;' wins, and the string
+# group tolerates a missing closing quote (consumes to end of input).
+_TOKEN_RE = re.compile(
+    r'(?P<comment>;;[^\n]*)'
+    r'|(?P<delim>[(){}\[\]])'
+    r'|(?P<string>"[^"]*"?)'
+    r'|(?P<atom>(?:[^\s(){}\[\]";]|;(?!;))+)'
+)
+
 
 class SExprParser:
     """Parse S-expression strings into Python AST (nested lists/atoms).
@@ -37,29 +76,17 @@ class SExprParser:
     """
 
     def tokenize(self, source: str) -> list[str]:
-        """Tokenize an S-expression string into a flat list of tokens."""
-        # Handle string literals by temporarily replacing them
-        strings: list[str] = []
-        def replace_string(match: re.Match) -> str:
-            strings.append(match.group(0))
-            return f"__STR_{len(strings) - 1}__"
-
-        cleaned = re.sub(r'"[^"]*"', replace_string, source)
-        # Remove comments (;; to end of line)
-        cleaned = re.sub(r';;[^\n]*', '', cleaned)
-        # Pad all delimiters with spaces
-        for ch in '(){}[]':
-            cleaned = cleaned.replace(ch, f' {ch} ')
-        tokens = cleaned.split()
-        # Restore string literals
-        restored = []
-        for t in tokens:
-            m = re.match(r'^__STR_(\d+)__$', t)
-            if m:
-                restored.append(strings[int(m.group(1))])
-            else:
-                restored.append(t)
-        return restored
+        """Tokenize an S-expression string into a flat list of tokens.
+
+        Single traversal of the source via one compiled alternation:
+        string literals keep their quotes, ;; comments and whitespace
+        are skipped, delimiters and atoms are emitted as-is.
+        """
+        return [
+            m.group()
+            for m in _TOKEN_RE.finditer(source)
+            if m.lastgroup != "comment"
+        ]
 
     def parse(self, source: str) -> dict[str, Any]:
         """Parse an S-expression string and return a result dict.
@@ -68,56 +95,73 @@ class SExprParser:
             {"valid": True, "ast": <parsed AST>, "skill_id": <id if skill def>}
             or {"valid": False, "error": "<message>"}
         """
-        try:
-            tokens = self.tokenize(source)
-            if not tokens:
-                return {"valid": False, "error": "Empty input"}
-            ast, remaining = self._parse_expr(tokens)
-            result: dict[str, Any] = {"valid": True, "ast": ast}
-            # Extract skill_id if this is a define-skill form
-            if isinstance(ast, list) and len(ast) >= 2 and ast[0] == "define-skill":
-                result["skill_id"] = ast[1]
-            return result
-        except Exception as e:
-            return {"valid": False, "error": str(e)}
-
-    def _parse_expr(self, tokens: list[str]) -> tuple[Any, list[str]]:
-        if not tokens:
+        valid, payload, skill_id = _parse_cached(source)
+        if not valid:
+            return {"valid": False, "error": payload}
+        # Thaw the cached immutable AST into fresh lists/dicts so callers
+        # can mutate their copy without poisoning the cache.
+        result: dict[str, Any] = {"valid": True, "ast": _thaw(payload)}
+        if skill_id is not None:
+            result["skill_id"] = skill_id
+        return result
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all memoized parse results (useful in tests)."""
+        _parse_cached.cache_clear()
+
+    _CLOSER_TO_OPENER = {')': '(', '}': '{', ']': '['}
+    _UNCLOSED_MESSAGES = {
+        '(': "Unclosed parenthesis",
+        '{': "Unclosed curly brace",
+        '[': "Unclosed square bracket",
+    }
+
+    def _parse_expr(self, tokens: list[str], i: int) -> tuple[Any, int]:
+        """Parse one expression starting at index ``i``.
+
+        Returns (ast, next_index). Nesting is handled iteratively with an
+        explicit stack of partially-built collections, so deeply nested
+        expressions cost no Python call frames and cannot hit the
+        recursion limit.
+        """
+        if i >= len(tokens):
             raise ValueError("Unexpected end of input")
-        token = tokens[0]
-        if token == '(':
-            return self._parse_list(tokens[1:])
-        elif token == '{':
-            return self._parse_map(tokens[1:])
-        elif token == '[':
-            return self._parse_vector(tokens[1:])
-        elif token in (')', '}', ']'):
+        token = tokens[i]
+        if token in (')', '}', ']'):
             raise ValueError(f"Unexpected closing delimiter: {token}")
-        else:
-            return self._parse_atom(tokens[0]), tokens[1:]
-
-    def _parse_list(self, tokens: list[str]) -> tuple[list, list[str]]:
-        result: list[Any] = []
-        while tokens and tokens[0] != ')':
-            expr, tokens = self._parse_expr(tokens)
-            result.append(expr)
-        if not tokens:
-            raise ValueError("Unclosed parenthesis")
-        return result, tokens[1:]  # skip the ')'
+        if token not in ('(', '{', '['):
+            return self._parse_atom(token), i + 1
+
+        # Stack of (opening delimiter, collected items) frames
+        stack: list[tuple[str, list]] = [(token, [])]
+        i += 1
+        n = len(tokens)
+        while True:
+            if i >= n:
+                raise ValueError(self._UNCLOSED_MESSAGES[stack[-1][0]])
+            token = tokens[i]
+            i += 1
+            if token in ('(', '{', '['):
+                stack.append((token, []))
+            elif token in (')', '}', ']'):
+                opener, items = stack.pop()
+                if opener != self._CLOSER_TO_OPENER[token]:
+                    raise ValueError(f"Unexpected closing delimiter: {token}")
+                value: Any = self._build_map(items) if opener == '{' else items
+                if not stack:
+                    return value, i
+                stack[-1][1].append(value)
+            else:
+                stack[-1][1].append(self._parse_atom(token))
 
-    def _parse_map(self, tokens: list[str]) -> tuple[dict, list[str]]:
-        """Parse {key value key value ...} into a Python dict."""
+    @staticmethod
+    def _build_map(items: list[Any]) -> dict[str, Any]:
+        """Pair up [key1 val1 key2 val2 ...] items into a Python dict."""
         result: dict[str, Any] = {}
-        items: list[Any] = []
-        while tokens and tokens[0] != '}':
-            expr, tokens = self._parse_expr(tokens)
-            items.append(expr)
-        if not tokens:
-            raise ValueError("Unclosed curly brace")
-        # Pair up items: key1 val1 key2 val2 ...
-        for i in range(0, len(items) - 1, 2):
-            key = items[i]
-            val = items[i + 1]
+        for j in range(0, len(items) - 1, 2):
+            key = items[j]
+            val = items[j + 1]
             # Strip leading colon from keyword keys for Python dict
             if isinstance(key, str) and key.startswith(':'):
                 key = key[1:]
@@ -129,22 +173,12 @@ class SExprParser:
                 result[last[1:]] = None
             else:
                 result[str(last)] = None
-        return result, tokens[1:]  # skip the '}'
-
-    def _parse_vector(self, tokens: list[str]) -> tuple[list, list[str]]:
-        """Parse [a b c] into a Python list."""
-        result: list[Any] = []
-        while tokens and tokens[0] != ']':
-            expr, tokens = self._parse_expr(tokens)
-            result.append(expr)
-        if not tokens:
-            raise ValueError("Unclosed square bracket")
-        return result, tokens[1:]  # skip the ']'
+        return result
 
     def _parse_atom(self, token: str) -> Any:
-        # Keywords (:keyword)
+        # Keywords (:keyword) — interned, they recur across skills/runs
         if token.startswith(':'):
-            return token
+            return sys.intern(token)
         # Strings
         if token.startswith('"') and token.endswith('"'):
             return token[1:-1]
@@ -164,12 +198,12 @@ class SExprParser:
             return float(token)
         except ValueError:
             pass
-        # Symbol
-        return token
+        # Symbol — interned for pointer-fast equality checks downstream
+        return sys.intern(token)
 
     def ast_to_skill(self, ast: list) -> dict[str, Any] | None:
         """Convert a parsed skill AST into a skill definition dict."""
-        if not isinstance(ast, list) or len(ast) < 2 or ast[0] != "define-skill":
+        if not isinstance(ast, list) or len(ast) < 2 or ast[0] != _DEFINE_SKILL:
             return None
         skill: dict[str, Any] = {
             "id": ast[1],
@@ -180,11 +214,11 @@ class SExprParser:
         }
         for item in ast[2:]:
             if isinstance(item, list) and item:
-                if item[0] == "inputs":
+                if item[0] == _INPUTS:
                     skill["inputs"] = item[1:]
-                elif item[0] == "outputs":
+                elif item[0] == _OUTPUTS:
                     skill["outputs"] = item[1:]
-                elif item[0] == "state" and len(item) > 1:
+                elif item[0] == _STATE and len(item) > 1:
                     # state arg is now a parsed dict (from {}) or a list
                     raw = item[1]
                     if isinstance(raw, dict):
@@ -194,11 +228,709 @@ class SExprParser:
                         skill["state"] = raw
                     else:
                         skill["state"] = raw
-                elif item[0] == "compute":
+                elif item[0] == _COMPUTE:
                     skill["compute"] = item[1:]
         return skill
 
 
+class _MapTag:
+    """Marker distinguishing frozen maps from frozen lists in the parse cache.
+
+    The class object itself is the tag: classes pickle by reference, so the
+    identity check in _thaw survives a round trip through the disk cache.
+    """
+
+
+_MAP_TAG = _MapTag
+
+
+def _freeze(node: Any) -> Any:
+    """Convert a parsed AST into a hashable, immutable equivalent."""
+    if isinstance(node, list):
+        return tuple(_freeze(x) for x in node)
+    if isinstance(node, dict):
+        return (_MAP_TAG, tuple((k, _freeze(v)) for k, v in node.items()))
+    return node
+
+
+def _thaw(node: Any) -> Any:
+    """Rebuild fresh lists/dicts from a frozen AST."""
+    if isinstance(node, tuple):
+        if node and node[0] is _MAP_TAG:
+            return {k: _thaw(v) for k, v in node[1]}
+        return [_thaw(x) for x in node]
+    return node
+
+
+# Bump when the frozen-AST layout changes so stale cache entries are ignored.
+_PARSE_CACHE_VERSION = 1
+
+# Off switch for the on-disk half (the in-memory memo stays on): set
+# NEOEXCELPPT_PARSE_CACHE=0 to keep runs from writing into the per-user
+# cache dir. Test suites should disable it rather than leak pickles into
+# the developer's home.
+_DISK_CACHE_ENABLED = os.environ.get("NEOEXCELPPT_PARSE_CACHE", "1") != "0"
+
+_DISK_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache"))
+    / "neoexcelppt"
+    / "sexpr"
+)
+
+
+def _disk_cache_load(source: str) -> tuple[bool, Any, Any] | None:
+    if not _DISK_CACHE_ENABLED:
+        return None
+    path = _DISK_CACHE_DIR / (hashlib.sha1(source.encode()).hexdigest() + ".pkl")
+    try:
+        with open(path, "rb") as f:
+            version, result = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, ValueError):
+        return None
+    return result if version == _PARSE_CACHE_VERSION else None
+
+
+def _disk_cache_store(source: str, result: tuple[bool, Any, Any]) -> None:
+    if not _DISK_CACHE_ENABLED:
+        return
+    path = _DISK_CACHE_DIR / (hashlib.sha1(source.encode()).hexdigest() + ".pkl")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # tmp + replace so a concurrent reader never sees a half-written
+        # pickle (same pattern as the bridge's live-result cache).
+        tmp = path.with_suffix(".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump((_PARSE_CACHE_VERSION, result), f)
+        os.replace(tmp, path)
+    except (OSError, pickle.PickleError):
+        pass  # the disk cache is best-effort
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_cached(source: str) -> tuple[bool, Any, Any]:
+    """Packrat-style memo for SExprParser.parse.
+
+    Consumers (tests, REPL loops, UpskillBridge) repeatedly parse the same
+    skill S-expressions; this caches the tokenize+parse work keyed by the
+    source string. Returns (valid, frozen_ast_or_error, skill_id).
+
+    Valid results are also pickled to a per-user disk cache keyed by the
+    source sha1, so warm starts skip tokenize+parse entirely.
+    """
+    cached = _disk_cache_load(source)
+    if cached is not None:
+        return cached
+    try:
+        tokens = _CACHE_PARSER.tokenize(source)
+        if not tokens:
+            return (False, "Empty input", None)
+        ast, _ = _CACHE_PARSER._parse_expr(tokens, 0)
+    except Exception as e:
+        return (False, str(e), None)
+    skill_id = None
+    if isinstance(ast, list) and len(ast) >= 2 and ast[0] == _DEFINE_SKILL:
+        skill_id = ast[1]
+    result = (True, _freeze(ast), skill_id)
+    _disk_cache_store(source, result)
+    return result
+
+
+_CACHE_PARSER = SExprParser()
+
+
+# =============================================================================
+# S-Expression Compiler (closure tree + stack bytecode)
+# =============================================================================
+# Straight-line value-producing operators (arithmetic, comparison, get/set/
+# emit, collection helpers) are lowered to flat postfix bytecode executed by
+# one stack loop in `_run`, so deeply nested math costs a single Python frame.
+# Operators that need short-circuiting or their own scope (and/or/let/if/do)
+# stay as closures `fn(env) -> value` built by the `_make_*` helpers; the two
+# forms nest freely via the RUNFN opcode.
+
+_NUMERIC = (int, float)
+
+# Below this many elements the numpy call overhead outweighs the C loop
+_NP_SUM_THRESHOLD = 64
+
+
+def _sum_numeric(values: Any, n: int) -> Any:
+    """Reduce ``values``, vectorizing via numpy for large all-numeric runs.
+
+    The fast path engages only when every element is exactly int or float:
+    fromiter would happily coerce numeric strings, which the filtering loop
+    ignores, and the result must stay int when the inputs were all ints —
+    the semantics cannot depend on whether numpy is installed.
+    """
+    if _np is not None and n >= _NP_SUM_THRESHOLD:
+        all_int = True
+        for v in values:
+            if type(v) is float:
+                all_int = False
+            elif type(v) is not int:
+                break  # str/bool/other: filtering-loop semantics
+        else:
+            try:
+                if all_int:
+                    # int64 keeps exact integer semantics; huge Python ints
+                    # overflow fromiter and fall back to the exact loop.
+                    return int(
+                        _np.fromiter(values, dtype=_np.int64, count=n).sum()
+                    )
+                return float(_np.fromiter(values, dtype=float, count=n).sum())
+            except (TypeError, ValueError, OverflowError):
+                pass
+    return sum(v for v in values if isinstance(v, _NUMERIC))
+
+(
+    _OP_CONST,
+    _OP_RUNFN,
+    _OP_ADD,
+    _OP_NEG,
+    _OP_SUB,
+    _OP_MUL,
+    _OP_DIV,
+    _OP_CMP,
+    _OP_NOT,
+    _OP_GET,
+    _OP_SET,
+    _OP_EMIT,
+    _OP_SUM,
+    _OP_COUNT,
+    _OP_MERGE,
+    _OP_ASSOC,
+    _OP_STR,
+    _OP_SUM_VALUES,
+    _OP_STORE_TMP,
+    _OP_LOAD_TMP,
+    _OP_ADD_NUM,
+    _OP_GET_STATE,
+    _OP_GET_INPUT,
+) = range(23)
+
+# Operators that lower to bytecode (everything evaluated left-to-right with
+# no short-circuiting and no new scope).
+_LOWERABLE = frozenset((
+    '+', '-', '*', '/',
+    '>', '<', '>=', '<=', '=',
+    'not',
+    'get', 'set', 'emit',
+    'sum', 'count', 'merge', 'assoc', 'str', 'sum-values',
+))
+
+_CMP_FNS = {
+    '>': operator.gt,
+    '<': operator.lt,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '=': operator.eq,
+}
+
+
+def _strip_kw(key: Any) -> Any:
+    return key[1:] if isinstance(key, str) and key.startswith(':') else key
+
+
+# Lowerable ops with no side effects: candidates for common-subexpression
+# elimination when their leaves are constants or input-channel reads.
+_PURE_LOWERABLE = _LOWERABLE - {'set', 'emit'}
+
+
+def _input_only(ast: Any) -> bool:
+    """True if ``ast`` is side-effect-free and reads only input channels.
+
+    Nothing writes the input bucket during a run, so such subtrees always
+    produce the same value within one evaluate() call and can be computed
+    once per program.
+    """
+    if ast is None or isinstance(ast, (bool, int, float)):
+        return True
+    if isinstance(ast, str):
+        return ast.startswith(':')
+    if isinstance(ast, list) and ast and isinstance(ast[0], str):
+        op = ast[0]
+        if op == 'get':
+            return (
+                len(ast) >= 2
+                and ast[1] == 'input'
+                and all(isinstance(a, str) and a.startswith(':') for a in ast[2:])
+            )
+        if op in _PURE_LOWERABLE:
+            return all(_input_only(a) for a in ast[1:])
+    return False
+
+
+def _static_num(ast: Any) -> bool:
+    """True if ``ast`` always evaluates to a number (bools included)."""
+    if isinstance(ast, (bool, int, float)):
+        return True
+    if isinstance(ast, list) and ast and isinstance(ast[0], str):
+        op = ast[0]
+        # These produce a number by construction regardless of their inputs
+        if op in ('+', 'sum', 'count', 'sum-values', '/'):
+            return True
+        if op in _CMP_FNS or op in ('not', 'and', 'or'):
+            return True
+        if op in ('-', '*'):
+            return all(_static_num(a) for a in ast[1:])
+        if op == 'if':
+            return len(ast) == 4 and _static_num(ast[2]) and _static_num(ast[3])
+    return False
+
+
+def _collect_cse_counts(ast: Any, counts: dict[Any, int]) -> None:
+    """Count occurrences of pure input-only subtrees within one program."""
+    if not (
+        isinstance(ast, list)
+        and ast
+        and isinstance(ast[0], str)
+        and ast[0] in _LOWERABLE
+    ):
+        return
+    if _input_only(ast):
+        key = _freeze(ast)
+        counts[key] = counts.get(key, 0) + 1
+    for a in ast[1:]:
+        _collect_cse_counts(a, counts)
+
+
+def _lower_node(ast: Any, code: list[tuple[int, Any]], cse: dict | None = None) -> None:
+    """Append postfix instructions that compute ``ast`` onto ``code``."""
+    if ast is None or isinstance(ast, (bool, int, float)):
+        code.append((_OP_CONST, ast))
+        return
+    if isinstance(ast, str) and ast.startswith(':'):
+        code.append((_OP_CONST, ast))
+        return
+    if (
+        isinstance(ast, list)
+        and ast
+        and isinstance(ast[0], str)
+        and ast[0] in _LOWERABLE
+    ):
+        # Repeated pure subtree: compute once, then reuse from a temp slot.
+        # Execution of one program is strictly linear, so the store always
+        # precedes its loads.
+        store_slot = None
+        if cse is not None and _input_only(ast):
+            key = _freeze(ast)
+            if cse["counts"].get(key, 0) > 1:
+                slot = cse["slots"].get(key)
+                if slot is not None:
+                    code.append((_OP_LOAD_TMP, slot))
+                    return
+                store_slot = cse["slots"][key] = len(cse["slots"])
+        op = ast[0]
+        args = ast[1:]
+        if op == '+':
+            for a in args:
+                _lower_node(a, code, cse)
+            # Statically numeric operands skip the per-element type filter
+            if args and all(_static_num(a) for a in args):
+                code.append((_OP_ADD_NUM, len(args)))
+            else:
+                code.append((_OP_ADD, len(args)))
+        elif op == '-':
+            _lower_node(args[0], code, cse)
+            if len(args) == 1:
+                code.append((_OP_NEG, None))
+            else:
+                _lower_node(args[1], code, cse)
+                code.append((_OP_SUB, None))
+        elif op == '*':
+            _lower_node(args[0], code, cse)
+            _lower_node(args[1], code, cse)
+            code.append((_OP_MUL, None))
+        elif op == '/':
+            _lower_node(args[0], code, cse)
+            _lower_node(args[1], code, cse)
+            code.append((_OP_DIV, None))
+        elif op in _CMP_FNS:
+            _lower_node(args[0], code, cse)
+            _lower_node(args[1], code, cse)
+            code.append((_OP_CMP, _CMP_FNS[op]))
+        elif op == 'not':
+            _lower_node(args[0], code, cse)
+            code.append((_OP_NOT, None))
+        elif op == 'get':
+            key = args[1] if args[1:] else None
+            # (get state :k) / (get input :k) resolve to fixed env slots;
+            # skip the symbol lookup and target-type checks entirely.
+            if (
+                args[0] in ('state', 'input')
+                and isinstance(key, str)
+                and key.startswith(':')
+            ):
+                opcode = _OP_GET_STATE if args[0] == 'state' else _OP_GET_INPUT
+                code.append((opcode, (key, key[1:])))
+            else:
+                _lower_node(args[0], code, cse)
+                code.append((_OP_GET, (key, _strip_kw(key))))
+        elif op == 'set':
+            _lower_node(args[1], code, cse)
+            code.append((_OP_SET, _strip_kw(args[0])))
+        elif op == 'emit':
+            _lower_node(args[1], code, cse)
+            code.append((_OP_EMIT, _strip_kw(args[0])))
+        elif op == 'sum':
+            _lower_node(args[0], code, cse)
+            code.append((_OP_SUM, None))
+        elif op == 'count':
+            _lower_node(args[0], code, cse)
+            code.append((_OP_COUNT, None))
+        elif op == 'merge':
+            _lower_node(args[0], code, cse)
+            _lower_node(args[1], code, cse)
+            code.append((_OP_MERGE, None))
+        elif op == 'assoc':
+            _lower_node(args[0], code, cse)
+            _lower_node(args[2], code, cse)
+            code.append((_OP_ASSOC, _strip_kw(args[1])))
+        elif op == 'str':
+            for a in args:
+                _lower_node(a, code, cse)
+            code.append((_OP_STR, len(args)))
+        else:  # 'sum-values'
+            _lower_node(args[0], code, cse)
+            code.append((_OP_SUM_VALUES, None))
+        if store_slot is not None:
+            code.append((_OP_STORE_TMP, store_slot))
+        return
+    # Symbols, maps, control forms, unknown calls: fall back to a closure
+    code.append((_OP_RUNFN, _compile(ast)))
+
+
+def _run(code: list[tuple[int, Any]], env: dict, nslots: int = 0) -> Any:
+    """Execute lowered bytecode against ``env`` with an explicit value stack."""
+    stack: list[Any] = []
+    push = stack.append
+    pop = stack.pop
+    tmps = [None] * nslots if nslots else None
+    for op, arg in code:
+        if op == _OP_CONST:
+            push(arg)
+        elif op == _OP_RUNFN:
+            push(arg(env))
+        elif op == _OP_GET_STATE or op == _OP_GET_INPUT:
+            target = env["state"] if op == _OP_GET_STATE else env["input"]
+            if isinstance(target, dict):
+                key, clean_key = arg
+                if clean_key in target:
+                    push(target[clean_key])
+                else:
+                    push(target.get(key))
+            else:
+                # A let binding shadowed the slot with a non-dict value
+                push(target)
+        elif op == _OP_GET:
+            key, clean_key = arg
+            target = pop()
+            if isinstance(target, str):
+                if target == 'state':
+                    target = env["state"]
+                elif target == 'input':
+                    target = env["input"]
+            if isinstance(target, dict) and key is not None:
+                # Keys were stripped at compile time; the raw-keyword lookup
+                # only runs for caller-supplied dicts that kept their colons.
+                if clean_key in target:
+                    push(target[clean_key])
+                else:
+                    push(target.get(key))
+            else:
+                push(target)
+        elif op == _OP_ADD_NUM:
+            vals = stack[-arg:]
+            del stack[-arg:]
+            push(sum(vals))
+        elif op == _OP_ADD:
+            if arg:
+                vals = stack[-arg:]
+                del stack[-arg:]
+            else:
+                vals = []
+            push(sum(v for v in vals if isinstance(v, _NUMERIC)))
+        elif op == _OP_MUL:
+            b = pop()
+            push(pop() * b)
+        elif op == _OP_SUB:
+            b = pop()
+            push(pop() - b)
+        elif op == _OP_NEG:
+            push(-pop())
+        elif op == _OP_DIV:
+            b = pop()
+            a = pop()
+            push(0 if b == 0 else a / b)
+        elif op == _OP_CMP:
+            b = pop()
+            push(arg(pop(), b))
+        elif op == _OP_NOT:
+            push(not pop())
+        elif op == _OP_SET:
+            # Value stays on the stack as the expression's result
+            env["state"][arg] = stack[-1]
+        elif op == _OP_EMIT:
+            env["_emissions"][arg] = stack[-1]
+        elif op == _OP_SUM:
+            lst = pop()
+            if isinstance(lst, (list, tuple)):
+                push(_sum_numeric(lst, len(lst)))
+            elif isinstance(lst, dict):
+                push(_sum_numeric(lst.values(), len(lst)))
+            else:
+                push(0)
+        elif op == _OP_COUNT:
+            lst = pop()
+            push(len(lst) if hasattr(lst, '__len__') else 0)
+        elif op == _OP_MERGE:
+            b = pop()
+            a = pop()
+            if isinstance(a, dict) and isinstance(b, dict):
+                push({**a, **b})
+            else:
+                push(b)
+        elif op == _OP_ASSOC:
+            val = pop()
+            m = pop()
+            if isinstance(m, dict):
+                push({**m, arg: val})
+            else:
+                push({arg: val})
+        elif op == _OP_STR:
+            if arg:
+                parts = stack[-arg:]
+                del stack[-arg:]
+            else:
+                parts = []
+            push("".join(str(p) for p in parts))
+        elif op == _OP_SUM_VALUES:
+            m = pop()
+            if isinstance(m, dict):
+                push(_sum_numeric(m.values(), len(m)))
+            else:
+                push(0)
+        elif op == _OP_STORE_TMP:
+            # Value stays on the stack as the expression's result
+            tmps[arg] = stack[-1]
+        else:  # _OP_LOAD_TMP
+            push(tmps[arg])
+    return stack[-1] if stack else None
+
+
+# ---------------------------------------------------------------------------
+# Numeric kernel codegen (optional Numba JIT)
+# ---------------------------------------------------------------------------
+# Compute bodies that are pure scalar math over input/state channels are
+# translated to a plain Python expression function; when numba is installed
+# the function is additionally @njit-compiled (lazily, on first call). The
+# interpreted program is kept as the fallback for missing or non-numeric
+# channel values, so semantics never depend on the JIT being present.
+
+
+def _numeric_expr(ast: Any, params: dict[tuple[str, str], str]) -> str | None:
+    """Render ``ast`` as a Python expression over scalar parameters.
+
+    Returns None as soon as anything non-numeric is encountered; ``params``
+    accumulates (bucket, key) -> parameter-name for every channel reference.
+    """
+    if isinstance(ast, bool):
+        return "True" if ast else "False"
+    if isinstance(ast, (int, float)):
+        return repr(ast)
+    if not (isinstance(ast, list) and ast and isinstance(ast[0], str)):
+        return None
+    op, args = ast[0], ast[1:]
+    if (
+        op == 'get'
+        and len(args) == 2
+        and args[0] in ('input', 'state')
+        and isinstance(args[1], str)
+    ):
+        ref = (args[0], _strip_kw(args[1]))
+        name = params.get(ref)
+        if name is None:
+            name = params[ref] = f"v{len(params)}"
+        return name
+    subs = [_numeric_expr(a, params) for a in args]
+    if any(s is None for s in subs):
+        return None
+    if op == '+':
+        return "(" + " + ".join(subs) + ")" if subs else "0"
+    if op == '-':
+        if len(subs) == 1:
+            return f"(-{subs[0]})"
+        return f"({subs[0]} - {subs[1]})" if len(subs) == 2 else None
+    if op == '*' and len(subs) == 2:
+        return f"({subs[0]} * {subs[1]})"
+    if op == '/' and len(subs) == 2:
+        return f"(0 if {subs[1]} == 0 else {subs[0]} / {subs[1]})"
+    if op in _CMP_FNS and len(subs) == 2:
+        py_op = "==" if op == '=' else op
+        return f"({subs[0]} {py_op} {subs[1]})"
+    if op == 'and':
+        return "(" + " and ".join(f"bool({s})" for s in subs) + ")" if subs else "True"
+    if op == 'or':
+        return "(" + " or ".join(f"bool({s})" for s in subs) + ")" if subs else "False"
+    if op == 'not' and len(subs) == 1:
+        return f"(not {subs[0]})"
+    if op == 'if' and len(subs) == 3:
+        return f"({subs[1]} if {subs[0]} else {subs[2]})"
+    return None
+
+
+def _try_numeric_kernel(
+    ast: Any,
+) -> tuple[Callable[..., Any], tuple[tuple[str, str], ...]] | None:
+    """Build a scalar kernel for a pure-numeric AST, or None."""
+    params: dict[tuple[str, str], str] = {}
+    expr = _numeric_expr(ast, params)
+    if expr is None:
+        return None
+    names = ", ".join(params.values())
+    namespace: dict[str, Any] = {}
+    exec(f"def _kernel({names}):\n    return {expr}\n", namespace)
+    kernel = namespace["_kernel"]
+    if _numba is not None:
+        kernel = _numba.njit(kernel)
+    return kernel, tuple(params)
+
+
+def _wrap_kernel(
+    kernel: Callable[..., Any],
+    refs: tuple[tuple[str, str], ...],
+    fallback: Callable[[dict], Any],
+) -> Callable[[dict], Any]:
+    """Run ``kernel`` when every channel is a present numeric scalar."""
+
+    def run(env: dict) -> Any:
+        args = []
+        for bucket_name, key in refs:
+            bucket = env["input"] if bucket_name == 'input' else env["state"]
+            if key not in bucket:
+                return fallback(env)
+            v = bucket[key]
+            if not isinstance(v, _NUMERIC):
+                return fallback(env)
+            args.append(v)
+        try:
+            return kernel(*args)
+        except Exception:
+            # JIT typing failures and the like: stay on the interpreter
+            return fallback(env)
+
+    return run
+
+
+def _make_and(args: list) -> Callable[[dict], Any]:
+    fns = [_compile(a) for a in args]
+    return lambda env: all(f(env) for f in fns)
+
+
+def _make_or(args: list) -> Callable[[dict], Any]:
+    fns = [_compile(a) for a in args]
+    return lambda env: any(f(env) for f in fns)
+
+
+def _make_let(args: list) -> Callable[[dict], Any]:
+    bindings = args[0]  # [name1 expr1 name2 expr2 ...]
+    pairs: list[tuple[Any, Callable[[dict], Any]]] = []
+    if isinstance(bindings, list):
+        for i in range(0, len(bindings) - 1, 2):
+            pairs.append((bindings[i], _compile(bindings[i + 1])))
+    body = [_compile(a) for a in args[1:]]
+
+    def run(env: dict) -> Any:
+        # New bindings shadow the parent scope without copying it; state and
+        # _emissions stay the parent's objects, so writes propagate directly.
+        local_env = ChainMap({}, env)
+        for name, vfn in pairs:
+            local_env[name] = vfn(local_env)
+        result = None
+        for bfn in body:
+            result = bfn(local_env)
+        return result
+
+    return run
+
+
+def _make_if(args: list) -> Callable[[dict], Any]:
+    cfn = _compile(args[0])
+    tfn = _compile(args[1])
+    efn = _compile(args[2]) if len(args) > 2 else None
+
+    def run(env: dict) -> Any:
+        if cfn(env):
+            return tfn(env)
+        if efn is not None:
+            return efn(env)
+        return None
+
+    return run
+
+
+def _make_do(args: list) -> Callable[[dict], Any]:
+    fns = [_compile(a) for a in args]
+
+    def run(env: dict) -> Any:
+        result = None
+        for f in fns:
+            result = f(env)
+        return result
+
+    return run
+
+
+_OPS: dict[str, Callable[[list], Callable[[dict], Any]]] = {
+    'and': _make_and,
+    'or': _make_or,
+    'let': _make_let,
+    'if': _make_if,
+    'do': _make_do,
+    'seq': _make_do,
+}
+
+
+def _compile(ast: Any) -> Callable[[dict], Any]:
+    """Compile an AST node into a closure ``fn(env) -> value``."""
+    # Atoms fold to constants
+    if ast is None or isinstance(ast, (bool, int, float)):
+        return lambda env: ast
+    if isinstance(ast, str):
+        if ast.startswith(':'):
+            return lambda env: ast  # keyword literal
+        # Symbol lookup in local env, falling back to the bare name
+        return lambda env: env[ast] if ast in env else ast
+    if isinstance(ast, dict):
+        items = [(k, _compile(v)) for k, v in ast.items()]
+        return lambda env: {k: f(env) for k, f in items}
+
+    if not isinstance(ast, list) or not ast:
+        return lambda env: ast
+
+    op = ast[0]
+    if isinstance(op, str):
+        if op in _LOWERABLE:
+            counts: dict[Any, int] = {}
+            _collect_cse_counts(ast, counts)
+            cse = (
+                {"counts": counts, "slots": {}}
+                if any(n > 1 for n in counts.values())
+                else None
+            )
+            code: list[tuple[int, Any]] = []
+            _lower_node(ast, code, cse)
+            nslots = len(cse["slots"]) if cse else 0
+            return lambda env: _run(code, env, nslots)
+        maker = _OPS.get(op)
+        if maker is not None:
+            return maker(ast[1:])
+
+    # Unknown function - evaluate elements and return the list as-is
+    fns = [_compile(a) for a in ast]
+    return lambda env: [f(env) for f in fns]
+
+
 # =============================================================================
 # S-Expression Evaluator
 # =============================================================================
@@ -227,15 +959,18 @@ class SExprEvaluator:
         # result.value == 30
     """
 
-    @dataclass
+    @dataclass(slots=True)
     class Result:
         value: Any = None
         state: dict[str, Any] = field(default_factory=dict)
         emissions: dict[str, Any] = field(default_factory=dict)
         error: str | None = None
 
+    __slots__ = ('parser', '_compile_cache')
+
     def __init__(self):
         self.parser = SExprParser()
+        self._compile_cache: dict[str, Callable[[dict], Any]] = {}
 
     def evaluate(
         self,
@@ -247,28 +982,36 @@ class SExprEvaluator:
 
         Args:
             source: S-expression string or pre-parsed AST
-            state: Skill state dict
-            inputs: Input channel values
+            state: Skill state dict, mutated in place by (set ...) — pass a
+                copy if the caller needs the original preserved
+            inputs: Input channel values (read-only during evaluation)
 
         Returns:
             Result with value, updated state, emissions, and any error.
         """
         env = {
-            "state": dict(state or {}),
-            "input": dict(inputs or {}),
+            "state": state if state is not None else {},
+            "input": inputs if inputs is not None else {},
             "_emissions": {},
         }
 
         try:
             if isinstance(source, str):
-                parsed = self.parser.parse(source)
-                if not parsed["valid"]:
-                    return self.Result(error=parsed["error"])
-                ast = parsed["ast"]
+                program = self._compile_cache.get(source)
+                if program is None:
+                    parsed = self.parser.parse(source)
+                    if not parsed["valid"]:
+                        return self.Result(error=parsed["error"])
+                    program = _compile(parsed["ast"])
+                    kernel = _try_numeric_kernel(parsed["ast"])
+                    if kernel is not None:
+                        program = _wrap_kernel(kernel[0], kernel[1], program)
+                    if len(self._compile_cache) < 512:
+                        self._compile_cache[source] = program
             else:
-                ast = source
+                program = _compile(source)
 
-            value = self._eval(ast, env)
+            value = program(env)
             return self.Result(
                 value=value,
                 state=env["state"],
@@ -281,172 +1024,91 @@ class SExprEvaluator:
                 emissions=env.get("_emissions", {}),
             )
 
+    def compile(self, ast: Any) -> Callable[[dict], Any]:
+        """Compile an AST into a closure ``fn(env) -> value``.
+
+        The returned program can be invoked repeatedly against fresh envs
+        without re-walking the AST.
+        """
+        return _compile(ast)
+
     def _eval(self, ast: Any, env: dict) -> Any:
-        # Atoms
-        if ast is None or isinstance(ast, (bool, int, float)):
-            return ast
-        if isinstance(ast, str):
-            if ast.startswith(':'):
-                return ast  # keyword literal
-            # Symbol lookup in local env
-            if ast in env:
-                return env[ast]
-            return ast  # unresolved symbol
-        if isinstance(ast, dict):
-            return {k: self._eval(v, env) for k, v in ast.items()}
-
-        # Must be a list (S-expression)
-        if not isinstance(ast, list) or not ast:
-            return ast
+        # Compatibility shim: compile-and-run a single node.
+        return _compile(ast)(env)
 
-        op = ast[0]
 
-        # Arithmetic
-        if op == '+':
-            vals = [self._eval(a, env) for a in ast[1:]]
-            return sum(v for v in vals if isinstance(v, (int, float)))
-        if op == '-':
-            if len(ast) == 2:
-                return -self._eval(ast[1], env)
-            a, b = self._eval(ast[1], env), self._eval(ast[2], env)
-            return a - b
-        if op == '*':
-            a, b = self._eval(ast[1], env), self._eval(ast[2], env)
-            return a * b
-        if op == '/':
-            a, b = self._eval(ast[1], env), self._eval(ast[2], env)
-            if b == 0:
-                return 0
-            return a / b
-
-        # Comparison
-        if op == '>':
-            return self._eval(ast[1], env) > self._eval(ast[2], env)
-        if op == '<':
-            return self._eval(ast[1], env) < self._eval(ast[2], env)
-        if op == '>=':
-            return self._eval(ast[1], env) >= self._eval(ast[2], env)
-        if op == '<=':
-            return self._eval(ast[1], env) <= self._eval(ast[2], env)
-        if op == '=':
-            return self._eval(ast[1], env) == self._eval(ast[2], env)
-
-        # Logic
-        if op == 'and':
-            return all(self._eval(a, env) for a in ast[1:])
-        if op == 'or':
-            return any(self._eval(a, env) for a in ast[1:])
-        if op == 'not':
-            return not self._eval(ast[1], env)
-
-        # State access
-        if op == 'get':
-            target = self._eval(ast[1], env)
-            key = ast[2] if len(ast) > 2 else None
-            if isinstance(target, str) and target == 'state':
-                target = env["state"]
-            elif isinstance(target, str) and target == 'input':
-                target = env["input"]
-            if isinstance(target, dict) and key is not None:
-                clean_key = key[1:] if isinstance(key, str) and key.startswith(':') else key
-                return target.get(clean_key, target.get(key))
-            return target
-
-        # State mutation
-        if op == 'set':
-            key = ast[1]
-            val = self._eval(ast[2], env)
-            clean_key = key[1:] if isinstance(key, str) and key.startswith(':') else key
-            env["state"][clean_key] = val
-            return val
-
-        # Emission
-        if op == 'emit':
-            channel = ast[1]
-            val = self._eval(ast[2], env)
-            clean_ch = channel[1:] if isinstance(channel, str) and channel.startswith(':') else channel
-            env["_emissions"][clean_ch] = val
-            return val
-
-        # Let bindings
-        if op == 'let':
-            bindings = ast[1]  # [name1 expr1 name2 expr2 ...]
-            local_env = dict(env)
-            if isinstance(bindings, list):
-                for i in range(0, len(bindings) - 1, 2):
-                    name = bindings[i]
-                    val = self._eval(bindings[i + 1], local_env)
-                    local_env[name] = val
-            # Evaluate body expressions
-            result = None
-            for body_expr in ast[2:]:
-                result = self._eval(body_expr, local_env)
-            # Propagate state/emissions back
-            env["state"] = local_env["state"]
-            env["_emissions"] = local_env["_emissions"]
-            return result
-
-        # If
-        if op == 'if':
-            cond = self._eval(ast[1], env)
-            if cond:
-                return self._eval(ast[2], env)
-            elif len(ast) > 3:
-                return self._eval(ast[3], env)
-            return None
+# =============================================================================
+# S-Expression Generator
+# =============================================================================
 
-        # Do (sequence)
-        if op in ('do', 'seq'):
-            result = None
-            for expr in ast[1:]:
-                result = self._eval(expr, env)
-            return result
 
-        # Collections
-        if op == 'sum':
-            lst = self._eval(ast[1], env)
-            if isinstance(lst, (list, tuple)):
-                return sum(v for v in lst if isinstance(v, (int, float)))
-            if isinstance(lst, dict):
-                return sum(v for v in lst.values() if isinstance(v, (int, float)))
-            return 0
-        if op == 'count':
-            lst = self._eval(ast[1], env)
-            return len(lst) if hasattr(lst, '__len__') else 0
-        if op == 'merge':
-            a = self._eval(ast[1], env)
-            b = self._eval(ast[2], env)
-            if isinstance(a, dict) and isinstance(b, dict):
-                return {**a, **b}
-            return b
-        if op == 'assoc':
-            m = self._eval(ast[1], env)
-            key = ast[2]
-            val = self._eval(ast[3], env)
-            clean_key = key[1:] if isinstance(key, str) and key.startswith(':') else key
-            if isinstance(m, dict):
-                return {**m, clean_key: val}
-            return {clean_key: val}
+# Patterns for the SKILL.md heuristic converter, compiled once
+_SKILL_NAME_RE = re.compile(r'#\s+(?:Skill:\s*)?(\S+)')
+_SKILL_SEXPR_RE = re.compile(r'\(define-skill[^)]*(?:\([^)]*\))*\)', re.DOTALL)
+_DOC_INPUTS_RE = re.compile(r'[Ii]nput[s]?:\s*(.+)')
+_DOC_OUTPUTS_RE = re.compile(r'[Oo]utput[s]?:\s*(.+)')
 
-        # String concat
-        if op == 'str':
-            parts = [str(self._eval(a, env)) for a in ast[1:]]
-            return "".join(parts)
 
-        # Sum values of a map
-        if op == 'sum-values':
-            m = self._eval(ast[1], env)
-            if isinstance(m, dict):
-                return sum(v for v in m.values() if isinstance(v, (int, float)))
-            return 0
+class SkillDef(NamedTuple):
+    """Fixed-shape skill record with the fields the generator consumes.
 
-        # Unknown function - return list as-is
-        return [self._eval(a, env) for a in ast]
+    Attribute access on a NamedTuple is cheaper than the string-keyed
+    dict lookups of the plain skill dicts; the generator accepts both.
+    """
 
+    id: str
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    state: Mapping[str, Any] = MappingProxyType({})
+    compute: Any = None
+
+
+def _emit_bool(gen: "SExprGenerator", v: bool, out: list[str]) -> None:
+    out.append("true" if v else "false")
+
+
+def _emit_none(gen: "SExprGenerator", v: None, out: list[str]) -> None:
+    out.append("nil")
+
+
+def _emit_number(gen: "SExprGenerator", v: Any, out: list[str]) -> None:
+    out.append(str(v))
+
+
+def _emit_str(gen: "SExprGenerator", v: str, out: list[str]) -> None:
+    # Keywords and embedded S-expressions pass through unquoted
+    if v.startswith(':') or v.startswith('('):
+        out.append(v)
+    else:
+        out.append('"')
+        out.append(v)
+        out.append('"')
+
+
+def _emit_dict(gen: "SExprGenerator", v: dict, out: list[str]) -> None:
+    gen._emit_map(v, out)
+
+
+def _emit_list(gen: "SExprGenerator", v: list, out: list[str]) -> None:
+    out.append("(")
+    for i, item in enumerate(v):
+        if i:
+            out.append(" ")
+        gen._emit_value(item, out)
+    out.append(")")
 
-# =============================================================================
-# S-Expression Generator
-# =============================================================================
+
+# Value emitters dispatched by exact type; bool precedes int naturally
+# because type() lookup never falls through to a superclass.
+_EMITTERS = {
+    bool: _emit_bool,
+    type(None): _emit_none,
+    int: _emit_number,
+    float: _emit_number,
+    str: _emit_str,
+    dict: _emit_dict,
+    list: _emit_list,
+}
 
 
 class SExprGenerator:
@@ -455,47 +1117,60 @@ class SExprGenerator:
     def __init__(self, indent_size: int = 2):
         self.indent_size = indent_size
 
-    def generate_from_skill_definition(self, skill_def: dict[str, Any]) -> str:
-        """Generate a complete (define-skill ...) S-expression from a dict."""
-        lines: list[str] = []
-        sid = skill_def.get("id", ":unknown")
-        lines.append(f"(define-skill {sid}")
+    def generate_from_skill_definition(
+        self, skill_def: dict[str, Any] | SkillDef
+    ) -> str:
+        """Generate a complete (define-skill ...) S-expression.
+
+        Accepts either a plain skill dict or a SkillDef record.
+
+        The clause shape is fixed (id, inputs, outputs, state, compute),
+        so this is a single pass that appends each present clause as a
+        self-contained line and closes the form with a final paren.
+        """
+        sio = io.StringIO()
+        self._write_skill(sio, skill_def)
+        return sio.getvalue()
+
+    def _write_skill(
+        self, sio: io.StringIO, skill_def: dict[str, Any] | SkillDef
+    ) -> None:
+        """Write a (define-skill ...) form directly into an output stream."""
+        if isinstance(skill_def, SkillDef):
+            sid = skill_def.id or ":unknown"
+            inputs = skill_def.inputs
+            outputs = skill_def.outputs
+            state = skill_def.state
+            compute = skill_def.compute
+        else:
+            sid = skill_def.get("id", ":unknown")
+            inputs = skill_def.get("inputs")
+            outputs = skill_def.get("outputs")
+            state = skill_def.get("state")
+            compute = skill_def.get("compute")
+
+        write = sio.write
+        write(f"(define-skill {sid}")
 
-        # Inputs
-        inputs = skill_def.get("inputs", [])
         if inputs:
-            inputs_str = " ".join(inputs)
-            lines.append(f"  (inputs {inputs_str})")
+            write(f"\n  (inputs {' '.join(inputs)})")
 
-        # Outputs
-        outputs = skill_def.get("outputs", [])
         if outputs:
-            outputs_str = " ".join(outputs)
-            lines.append(f"  (outputs {outputs_str})")
+            write(f"\n  (outputs {' '.join(outputs)})")
 
-        # State
-        state = skill_def.get("state", {})
         if state:
-            state_str = self._format_map(state)
-            lines.append(f"  (state {state_str})")
+            write(f"\n  (state {self._format_map(state)})")
 
-        # Compute
-        compute = skill_def.get("compute")
         if compute:
             if isinstance(compute, str):
-                lines.append(f"  (compute")
-                lines.append(f"    {compute}))")
+                write(f"\n  (compute\n    {compute})")
             elif isinstance(compute, list):
-                compute_str = self._format_expr(compute, depth=2)
-                lines.append(f"  (compute")
-                lines.append(f"    {compute_str}))")
+                write(f"\n  (compute\n    {self._format_expr(compute, depth=2)})")
             else:
-                lines.append(f"  (compute {compute}))")
-        else:
-            # Close the define-skill
-            lines[-1] += ")"
+                write(f"\n  (compute {compute})")
 
-        return "\n".join(lines)
+        # Close the define-skill on the last clause line
+        write(")")
 
     def generate_wiring(self, connections: list[dict[str, str]]) -> str:
         """Generate a (define-wiring ...) S-expression."""
@@ -514,17 +1189,17 @@ class SExprGenerator:
         in markdown and extracts structured definitions.
         """
         # Extract skill name
-        name_match = re.search(r'#\s+(?:Skill:\s*)?(\S+)', skill_doc)
+        name_match = _SKILL_NAME_RE.search(skill_doc)
         name = name_match.group(1).lower().replace(' ', '-') if name_match else "unknown"
 
         # Look for any S-expression blocks already in the doc
-        sexpr_match = re.search(r'\(define-skill[^)]*(?:\([^)]*\))*\)', skill_doc, re.DOTALL)
+        sexpr_match = _SKILL_SEXPR_RE.search(skill_doc)
         if sexpr_match:
             return sexpr_match.group(0)
 
         # Build from heuristics
-        inputs = re.findall(r'[Ii]nput[s]?:\s*(.+)', skill_doc)
-        outputs = re.findall(r'[Oo]utput[s]?:\s*(.+)', skill_doc)
+        inputs = _DOC_INPUTS_RE.findall(skill_doc)
+        outputs = _DOC_OUTPUTS_RE.findall(skill_doc)
 
         skill_def = {
             "id": f":{name}",
@@ -536,29 +1211,36 @@ class SExprGenerator:
         return self.generate_from_skill_definition(skill_def)
 
     def _format_map(self, m: dict) -> str:
-        pairs = []
-        for k, v in m.items():
-            key = f":{k}" if not str(k).startswith(':') else k
-            val = self._format_value(v)
-            pairs.append(f"{key} {val}")
-        return "{" + " ".join(pairs) + "}"
+        out: list[str] = []
+        self._emit_map(m, out)
+        return "".join(out)
 
     def _format_value(self, v: Any) -> str:
-        if isinstance(v, bool):
-            return "true" if v else "false"
-        if v is None:
-            return "nil"
-        if isinstance(v, (int, float)):
-            return str(v)
-        if isinstance(v, str):
-            if v.startswith(':') or v.startswith('('):
-                return v
-            return f'"{v}"'
-        if isinstance(v, dict):
-            return self._format_map(v)
-        if isinstance(v, list):
-            return "(" + " ".join(self._format_value(x) for x in v) + ")"
-        return str(v)
+        out: list[str] = []
+        self._emit_value(v, out)
+        return "".join(out)
+
+    def _emit_map(self, m: dict, out: list[str]) -> None:
+        """Append the formatted map tokens to the shared output buffer."""
+        out.append("{")
+        first = True
+        for k, v in m.items():
+            if not first:
+                out.append(" ")
+            first = False
+            key = str(k)
+            out.append(key if key.startswith(':') else f":{key}")
+            out.append(" ")
+            self._emit_value(v, out)
+        out.append("}")
+
+    def _emit_value(self, v: Any, out: list[str]) -> None:
+        """Append the formatted value tokens to the shared output buffer."""
+        emitter = _EMITTERS.get(type(v))
+        if emitter is not None:
+            emitter(self, v, out)
+        else:
+            out.append(str(v))
 
     def _format_expr(self, expr: list, depth: int = 0) -> str:
         if not expr:
@@ -580,6 +1262,9 @@ class SExprGenerator:
 class WiringGenerator:
     """Generate skill wiring S-expressions."""
 
+    # Shared stateless generator; no point allocating one per export
+    _GEN = SExprGenerator()
+
     def __init__(self):
         self.connections: list[dict[str, str]] = []
 
@@ -594,8 +1279,7 @@ class WiringGenerator:
         return self
 
     def to_sexpr(self) -> str:
-        gen = SExprGenerator()
-        return gen.generate_wiring(self.connections)
+        return self._GEN.generate_wiring(self.connections)
 
     def clear(self) -> None:
         self.connections.clear()
@@ -606,7 +1290,7 @@ class WiringGenerator:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class SExprNode:
     """A node in an S-expression action tree."""
 
@@ -614,21 +1298,33 @@ class SExprNode:
     operands: list[Any] = field(default_factory=list)
 
     def to_sexpr(self, depth: int = 0) -> str:
-        indent = "  " * depth
-        if not self.operands:
-            return f"({self.operator})"
-        parts = [self.operator]
-        for op in self.operands:
-            if isinstance(op, SExprNode):
-                parts.append(op.to_sexpr(depth + 1))
-            elif isinstance(op, str):
-                if op.startswith(':') or op.startswith('('):
-                    parts.append(op)
+        # Iterative pre-order walk with an explicit work stack; deep action
+        # trees cost no Python call frames. Stack entries are (literal,
+        # item): literal fragments are emitted as-is, nodes/operands are
+        # rendered.
+        out: list[str] = []
+        stack: list[tuple[bool, Any]] = [(False, self)]
+        while stack:
+            literal, item = stack.pop()
+            if literal:
+                out.append(item)
+            elif isinstance(item, SExprNode):
+                if not item.operands:
+                    out.append(f"({item.operator})")
+                else:
+                    out.append(f"({item.operator}")
+                    stack.append((True, ")"))
+                    for op in reversed(item.operands):
+                        stack.append((False, op))
+                        stack.append((True, " "))
+            elif isinstance(item, str):
+                if item.startswith(':') or item.startswith('('):
+                    out.append(item)
                 else:
-                    parts.append(f'"{op}"')
+                    out.append(f'"{item}"')
             else:
-                parts.append(str(op))
-        return "(" + " ".join(parts) + ")"
+                out.append(str(item))
+        return "".join(out)
 
 
 class ActionComposer:
@@ -10,7 +10,17 @@ found in lib/neo_excel_ppt/skills/*.ex.
 """
 
 from __future__ import annotations
-from typing import Any
+import sys
+from array import array
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple
+
+from models.skills.sexpr_generator import SExprEvaluator, SkillDef
+
+try:
+    from numba import njit  # optional JIT for the scalar hot-path kernels
+except ImportError:
+    njit = None
 
 
 # =============================================================================
@@ -206,27 +216,470 @@ DEFAULT_WIRING: list[dict[str, str]] = [
 # Skill Registry
 # =============================================================================
 
-SKILL_REGISTRY: dict[str, dict[str, Any]] = {
+# Read-only view: accidental registry mutation would silently poison the
+# derived constants below (SoA arrays, id table, evaluation order).
+SKILL_REGISTRY: Mapping[str, dict[str, Any]] = MappingProxyType({
     "project-scope": PROJECT_SCOPE_SKILL,
     "component-calculator": COMPONENT_CALCULATOR_SKILL,
     "activity-calculator": ACTIVITY_CALCULATOR_SKILL,
     "effort-aggregator": EFFORT_AGGREGATOR_SKILL,
     "buffer-calculator": BUFFER_CALCULATOR_SKILL,
+})
+
+
+# Hot/cold split of the registry. Compute-path loops want only id,
+# inputs, outputs, state, and compute; the ui subtree is 3-4 element
+# dicts per skill that only the interpreter/bridge layers read. The
+# views below share the canonical subtrees by reference (no copies);
+# the full dicts above stay canonical since consumers expect the "ui"
+# key on them.
+_HOT_KEYS = ("id", "inputs", "outputs", "state", "compute")
+SKILL_COMPUTE_REGISTRY: Mapping[str, dict[str, Any]] = MappingProxyType({
+    sid: {key: skill[key] for key in _HOT_KEYS}
+    for sid, skill in SKILL_REGISTRY.items()
+})
+SKILL_UI_REGISTRY: Mapping[str, dict[str, Any]] = MappingProxyType({
+    sid: skill["ui"] for sid, skill in SKILL_REGISTRY.items()
+})
+
+
+class WiringEdge(NamedTuple):
+    """One wiring connection as an immutable record.
+
+    Slimmer than the edge dicts (~80 bytes vs ~232) and the interned
+    fields make scheduler equality checks pointer compares.
+    """
+
+    from_skill: str
+    from_channel: str
+    to_skill: str
+    to_channel: str
+
+
+# Record view of DEFAULT_WIRING; the dict form above stays canonical for
+# consumers that subscript edges by string key.
+WIRING_EDGE_RECORDS: tuple[WiringEdge, ...] = tuple(
+    WiringEdge(
+        sys.intern(conn["from_skill"]),
+        sys.intern(conn["from_channel"]),
+        sys.intern(conn["to_skill"]),
+        sys.intern(conn["to_channel"]),
+    )
+    for conn in DEFAULT_WIRING
+)
+
+
+def _build_evaluation_order() -> list[str]:
+    """Topologically order skills along DEFAULT_WIRING (Kahn's algorithm).
+
+    Skills with no wiring edges keep their definition order.
+    """
+    skill_ids = list(SKILL_REGISTRY)
+    indegree = {sid: 0 for sid in skill_ids}
+    successors: dict[str, list[str]] = {sid: [] for sid in skill_ids}
+    for conn in DEFAULT_WIRING:
+        successors[conn["from_skill"]].append(conn["to_skill"])
+        indegree[conn["to_skill"]] += 1
+    ready = [sid for sid in skill_ids if indegree[sid] == 0]
+    order: list[str] = []
+    while ready:
+        sid = ready.pop(0)
+        order.append(sid)
+        for succ in successors[sid]:
+            indegree[succ] -= 1
+            if indegree[succ] == 0:
+                ready.append(succ)
+    return order
+
+
+# Static wiring means the evaluation order is a constant: schedulers iterate
+# this tuple instead of re-running a topo sort per tick.
+EVALUATION_ORDER: tuple[str, ...] = tuple(_build_evaluation_order())
+
+# Kahn's algorithm only emits skills whose dependencies resolved, so a
+# short order means DEFAULT_WIRING has a cycle. Fail at import rather than
+# letting tick loops silently skip the skills stuck on the cycle.
+if len(EVALUATION_ORDER) != len(SKILL_REGISTRY):
+    _stuck = sorted(set(SKILL_REGISTRY) - set(EVALUATION_ORDER))
+    raise ValueError(
+        f"DEFAULT_WIRING contains a cycle involving: {', '.join(_stuck)}"
+    )
+
+# Outgoing edges per skill as (from_channel, to_skill, to_channel) tuples,
+# for propagation loops that would otherwise rescan DEFAULT_WIRING.
+ADJACENCY: dict[str, tuple[tuple[str, str, str], ...]] = {
+    sid: tuple(
+        (conn["from_channel"], conn["to_skill"], conn["to_channel"])
+        for conn in DEFAULT_WIRING
+        if conn["from_skill"] == sid
+    )
+    for sid in EVALUATION_ORDER
+}
+
+
+# =============================================================================
+# Structure-of-Arrays Registry View
+# =============================================================================
+# Batch tick loops iterate these parallel tuples by a small int row index
+# instead of chasing per-skill dicts and rehashing the same string keys.
+# The dict registry above stays the canonical definition store; the arrays
+# are derived from it once at import time.
+
+SKILL_IDS: tuple[str, ...] = tuple(SKILL_REGISTRY)
+SKILL_INPUTS: tuple[tuple[str, ...], ...] = tuple(
+    tuple(skill["inputs"]) for skill in SKILL_REGISTRY.values()
+)
+SKILL_OUTPUTS: tuple[tuple[str, ...], ...] = tuple(
+    tuple(skill["outputs"]) for skill in SKILL_REGISTRY.values()
+)
+SKILL_STATE: tuple[dict[str, Any], ...] = tuple(
+    skill["state"] for skill in SKILL_REGISTRY.values()
+)
+SKILL_COMPUTE_SRC: tuple[str, ...] = tuple(
+    skill["compute"] for skill in SKILL_REGISTRY.values()
+)
+
+SKILL_INDEX: dict[str, int] = {sid: i for i, sid in enumerate(SKILL_IDS)}
+
+# Wiring edges re-expressed over small ints: each row is (from_skill,
+# from_channel, to_skill, to_channel) indexed into SKILL_IDS/CHANNEL_IDS,
+# so propagation loops compare and hash machine ints instead of strings.
+# DEFAULT_WIRING above remains the canonical string form.
+CHANNEL_IDS: tuple[str, ...] = tuple(dict.fromkeys(
+    ch
+    for conn in DEFAULT_WIRING
+    for ch in (conn["from_channel"], conn["to_channel"])
+)) + tuple(dict.fromkeys(
+    ch.lstrip(':')
+    for skill in SKILL_REGISTRY.values()
+    for ch in (*skill["inputs"], *skill["outputs"])
+    if ch.lstrip(':') not in {
+        c for conn in DEFAULT_WIRING
+        for c in (conn["from_channel"], conn["to_channel"])
+    }
+))
+CHANNEL_INDEX: dict[str, int] = {ch: i for i, ch in enumerate(CHANNEL_IDS)}
+WIRING_EDGES: tuple[tuple[int, int, int, int], ...] = tuple(
+    (
+        SKILL_INDEX[conn["from_skill"]],
+        CHANNEL_INDEX[conn["from_channel"]],
+        SKILL_INDEX[conn["to_skill"]],
+        CHANNEL_INDEX[conn["to_channel"]],
+    )
+    for conn in DEFAULT_WIRING
+)
+
+
+# Per-skill channel lists as int tuples over CHANNEL_INDEX, row-aligned
+# with SKILL_IDS, plus slot maps keyed on small-int pairs: a producer
+# finds every consumer input slot for one of its channels with a single
+# dict hit on ints instead of a linear string scan of DEFAULT_WIRING.
+SKILL_INPUT_IDX: tuple[tuple[int, ...], ...] = tuple(
+    tuple(CHANNEL_INDEX[ch.lstrip(':')] for ch in inputs)
+    for inputs in SKILL_INPUTS
+)
+SKILL_OUTPUT_IDX: tuple[tuple[int, ...], ...] = tuple(
+    tuple(CHANNEL_INDEX[ch.lstrip(':')] for ch in outputs)
+    for outputs in SKILL_OUTPUTS
+)
+
+INPUT_SLOT_OF: dict[tuple[int, int], int] = {
+    (skill_idx, chan_idx): slot
+    for skill_idx, row in enumerate(SKILL_INPUT_IDX)
+    for slot, chan_idx in enumerate(row)
+}
+
+_p2c: dict[tuple[int, int], list[tuple[int, int]]] = {}
+for _fs, _fc, _ts, _tc in WIRING_EDGES:
+    _p2c.setdefault((_fs, _fc), []).append((_ts, INPUT_SLOT_OF[(_ts, _tc)]))
+PRODUCER_TO_CONSUMER_SLOT: dict[tuple[int, int], tuple[tuple[int, int], ...]] = {
+    key: tuple(slots) for key, slots in _p2c.items()
 }
+del _p2c
+
+
+def _build_csr(edges: tuple[tuple[int, int, int, int], ...],
+               n: int, src: int, dst: int) -> tuple[array, array]:
+    """Bucket edges by their ``src`` column into CSR (row_ptr, col_idx)."""
+    counts = [0] * (n + 1)
+    for edge in edges:
+        counts[edge[src] + 1] += 1
+    for i in range(n):
+        counts[i + 1] += counts[i]
+    col = [0] * len(edges)
+    cursor = counts[:]
+    for edge in edges:
+        col[cursor[edge[src]]] = edge[dst]
+        cursor[edge[src]] += 1
+    return array('i', counts), array('i', col)
+
+
+# CSR adjacency over the integer edges, both directions: neighbors of skill
+# u are col[row_ptr[u]:row_ptr[u+1]], contiguous ints instead of an O(E)
+# scan of DEFAULT_WIRING per visit.
+OUT_EDGES_ROWPTR, OUT_EDGES_COL = _build_csr(WIRING_EDGES, len(SKILL_IDS), 0, 2)
+IN_EDGES_ROWPTR, IN_EDGES_COL = _build_csr(WIRING_EDGES, len(SKILL_IDS), 2, 0)
+
+
+def _compile_compute(source: str) -> Callable[[dict], Any] | None:
+    evaluator = SExprEvaluator()
+    parsed = evaluator.parser.parse(source)
+    if not parsed["valid"]:
+        return None
+    return evaluator.compile(parsed["ast"])
+
+
+# Compute bodies precompiled to closures fn(env) -> value, row-aligned with
+# SKILL_IDS; tick loops index these directly without re-parsing.
+SKILL_COMPUTE: tuple[Callable[[dict], Any] | None, ...] = tuple(
+    _compile_compute(src) for src in SKILL_COMPUTE_SRC
+)
+
+
+class Breakdown(NamedTuple):
+    """project-scope :component-breakdown as a fixed-shape record.
+
+    Python-side consumers use this instead of the three-key dict the
+    s-expression body emits: positional slots, no per-instance hashing,
+    and tuple equality for change detection.
+    """
+
+    simple: int
+    medium: int
+    complex: int
 
 
-def get_all_skills() -> list[dict[str, Any]]:
+_last_breakdown: Breakdown = Breakdown(0, 0, 0)
+
+
+def make_breakdown(simple: int, medium: int, complex: int) -> Breakdown:
+    """Build a Breakdown, reusing the previous instance when unchanged.
+
+    File counts rarely move between ticks; returning the cached instance
+    keeps downstream ``is``/equality checks on the fast path and avoids
+    churning a fresh tuple per tick.
+    """
+    global _last_breakdown
+    last = _last_breakdown
+    if last.simple == simple and last.medium == medium and last.complex == complex:
+        return last
+    _last_breakdown = Breakdown(simple, medium, complex)
+    return _last_breakdown
+
+
+def component_calc(
+    files: float, auto_pct: float, base_hours: float = 15.0
+) -> tuple[float, float]:
+    """component-calculator hot path: (scaled-effort, component-days).
+
+    Divisions are folded to multiplies (/100 -> *0.01, /8 -> *0.125) so the
+    body JIT-compiles to pure FP math.
+    """
+    scaled = files * base_hours * (1.0 - auto_pct * 0.01)
+    return scaled, scaled * 0.125
+
+
+def buffer_calc(
+    base: float,
+    leave_pct: float = 10.0,
+    dep_pct: float = 15.0,
+    learn_pct: float = 20.0,
+) -> tuple[float, float, float]:
+    """buffer-calculator hot path: (leave, dependency, learning) days."""
+    return base * leave_pct * 0.01, base * dep_pct * 0.01, base * learn_pct * 0.01
+
+
+def activity_apply_update(
+    activities: dict[str, float], total: float, update: dict[str, float]
+) -> float:
+    """activity-calculator hot path: delta-update the running total.
+
+    The s-expression body re-sums every activity after a merge, O(A) per
+    tick; here the total moves by (new - old) for each changed key only,
+    O(U) in the size of the update. Mutates ``activities`` in place, the
+    same in-place state convention the evaluator uses, and returns the
+    new :activity-totals value.
+    """
+    for key, value in update.items():
+        old = activities.get(key, 0)
+        if value != old:
+            total += value - old
+            activities[key] = value
+    return total
+
+
+def buffer_calc_specialized(base: float) -> tuple[float, tuple[float, float, float]]:
+    """buffer_calc partially evaluated at the default 10/15/20 percents.
+
+    Folding the percent-to-fraction divisions leaves one multiply for the
+    combined buffer plus one per breakdown entry. Returns
+    (buffer-days, (leave, dependency, learning)).
+    """
+    return base * 0.45, (base * 0.10, base * 0.15, base * 0.20)
+
+
+def run_all(
+    simple: float,
+    medium: float,
+    complex: float,
+    automation_pct: float = 0.0,
+    activity_total: float = 0.0,
+    buffer_days_in: float = 0.0,
+    base_hours: float = 15.0,
+) -> tuple[float, float, float, float, float]:
+    """The whole default graph fused into one straight-line pass.
+
+    Inlines the five skill bodies in evaluation order with the wiring
+    channels reduced to local variables, so a full tick is a handful of
+    FP ops with no env dicts, emission maps, or per-skill dispatch.
+    Returns (total-files, scaled-effort, component-days, total-days,
+    buffer-days) matching the emissions a wired tick would produce at
+    the default state.
+    """
+    total_files = simple + medium + complex
+    scaled = total_files * base_hours * (1.0 - automation_pct * 0.01)
+    total_days = scaled + activity_total + buffer_days_in
+    return (
+        total_files,
+        scaled,
+        scaled * 0.125,
+        total_days,
+        total_days * 0.45,
+    )
+
+
+if njit is not None:
+    component_calc = njit(cache=True, fastmath=True)(component_calc)
+    buffer_calc = njit(cache=True, fastmath=True)(buffer_calc)
+    buffer_calc_specialized = njit(cache=True, fastmath=True)(buffer_calc_specialized)
+    run_all = njit(cache=True, fastmath=True)(run_all)
+
+
+# =============================================================================
+# Self-Adjusting Change Propagation
+# =============================================================================
+
+class ChangePropagator:
+    """Incremental tick loop: re-run only skills whose inputs changed.
+
+    A full tick evaluates all five skills even when one input moved. This
+    runner keeps per-skill input/state dicts plus each skill's last
+    emissions, marks a skill dirty when one of its inputs actually changes
+    value, and on ``tick()`` walks EVALUATION_ORDER re-running only the
+    dirty ones. Downstream skills are dirtied only for emissions whose
+    value differs from the previous tick, so an unchanged intermediate
+    result cuts propagation off early.
+    """
+
+    def __init__(self) -> None:
+        self._states = {
+            sid: dict(SKILL_REGISTRY[sid]["state"]) for sid in EVALUATION_ORDER
+        }
+        self._inputs: dict[str, dict[str, Any]] = {
+            sid: {} for sid in EVALUATION_ORDER
+        }
+        self._emissions: dict[str, dict[str, Any]] = {
+            sid: {} for sid in EVALUATION_ORDER
+        }
+        self._dirty: set[str] = set()
+
+    def set_input(self, skill_id: str, channel: str, value: Any) -> None:
+        """Stage an input value; marks the skill dirty only on change."""
+        sid = skill_id.lstrip(':')
+        channel = channel.lstrip(':')
+        bucket = self._inputs[sid]
+        if channel not in bucket or bucket[channel] != value:
+            bucket[channel] = value
+            self._dirty.add(sid)
+
+    def tick(self) -> list[str]:
+        """Run dirty skills in evaluation order; returns the ids that ran."""
+        ran: list[str] = []
+        for sid in EVALUATION_ORDER:
+            if sid not in self._dirty:
+                continue
+            self._dirty.discard(sid)
+            fn = SKILL_COMPUTE[SKILL_INDEX[sid]]
+            if fn is None:
+                continue
+            env = {
+                "state": self._states[sid],
+                "input": self._inputs[sid],
+                "_emissions": {},
+            }
+            try:
+                fn(env)
+            except Exception:
+                # Partially-staged inputs are normal for an incremental
+                # runner: a skill whose compute still sees a missing
+                # channel is skipped clean, same as the evaluator turning
+                # the exception into Result(error=...). The next
+                # set_input() on the missing channel re-dirties it.
+                continue
+            emitted = env["_emissions"]
+            prev = self._emissions[sid]
+            for from_channel, to_skill, to_channel in ADJACENCY[sid]:
+                if from_channel in emitted and (
+                    from_channel not in prev
+                    or prev[from_channel] != emitted[from_channel]
+                ):
+                    self.set_input(to_skill, to_channel, emitted[from_channel])
+            prev.update(emitted)
+            ran.append(sid)
+        return ran
+
+    def emissions(self, skill_id: str) -> dict[str, Any]:
+        """Last emissions of a skill (clean channel names, no colon)."""
+        return self._emissions[skill_id.lstrip(':')]
+
+
+def get_compute_fn(skill_id: str) -> Callable[[dict], Any] | None:
+    """Return the AOT-compiled compute closure for a skill.
+
+    The closure takes the evaluator env dict ({"state", "input",
+    "_emissions"}) and runs the precompiled program directly — no parsing
+    or AST walking per tick. Kept out of the skill dicts themselves so
+    those stay JSON-serializable.
+    """
+    index = SKILL_INDEX.get(skill_id.lstrip(':'))
+    return SKILL_COMPUTE[index] if index is not None else None
+
+
+def skill_def_at(index: int) -> SkillDef:
+    """Return SoA row ``index`` as a generator-ready SkillDef record."""
+    return SkillDef(
+        id=f":{SKILL_IDS[index]}",
+        inputs=SKILL_INPUTS[index],
+        outputs=SKILL_OUTPUTS[index],
+        state=SKILL_STATE[index],
+        compute=SKILL_COMPUTE_SRC[index],
+    )
+
+
+# Accessor results are pure functions of the frozen registry; hand out
+# the same tuples instead of allocating a fresh list per call. Callers
+# that need a mutable list copy explicitly.
+_ALL_SKILLS: tuple[dict[str, Any], ...] = tuple(SKILL_REGISTRY.values())
+_ALL_SKILL_IDS: tuple[str, ...] = SKILL_IDS
+
+
+def get_all_skills() -> tuple[dict[str, Any], ...]:
     """Return all registered skill definitions."""
-    return list(SKILL_REGISTRY.values())
+    return _ALL_SKILLS
+
+
+# Both id spellings precomputed once, so lookups skip the per-call lstrip
+_SKILL_BY_ANY_ID: dict[str, dict[str, Any]] = {
+    **SKILL_REGISTRY,
+    **{f":{sid}": skill for sid, skill in SKILL_REGISTRY.items()},
+}
 
 
 def get_skill(skill_id: str) -> dict[str, Any] | None:
-    """Get a skill definition by ID."""
-    # Strip leading colon if present
-    clean_id = skill_id.lstrip(':')
-    return SKILL_REGISTRY.get(clean_id)
+    """Get a skill definition by ID (leading colon optional)."""
+    return _SKILL_BY_ANY_ID.get(skill_id)
 
 
-def get_skill_ids() -> list[str]:
+def get_skill_ids() -> tuple[str, ...]:
     """Return all registered skill IDs."""
-    return list(SKILL_REGISTRY.keys())
+    return _ALL_SKILL_IDS
@@ -18,20 +18,67 @@ See: https://github.com/huggingface/upskill
 
 from __future__ import annotations
 
+import hashlib
 import json
 import os
+import re
 import shutil
 import subprocess
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Any
 
 from models.skills.sexpr_generator import SExprParser, SExprGenerator, SExprEvaluator
 from models.skills.skill_definitions import SKILL_REGISTRY, DEFAULT_WIRING
 
+try:
+    import ahocorasick as _ahocorasick  # optional C multi-pattern matcher
+except ImportError:
+    _ahocorasick = None
+
+try:
+    import orjson as _orjson  # optional fast JSON for the subprocess/cache boundary
+except ImportError:
+    _orjson = None
+
+# In-process upskill entry points, preferred over the CLI: a direct call
+# skips process fork, interpreter startup, and argv JSON round-tripping
+# for every generate/eval, and keeps one warm interpreter across a batch.
+try:
+    from upskill.api import generate as _upskill_generate
+    from upskill.api import evaluate as _upskill_evaluate
+except ImportError:
+    _upskill_generate = None
+    _upskill_evaluate = None
+
+
+if _orjson is not None:
+    def _json_dumps(obj: Any, *, sort_keys: bool = False, default=None) -> str:
+        return _orjson.dumps(
+            obj,
+            option=_orjson.OPT_SORT_KEYS if sort_keys else 0,
+            default=default,
+        ).decode()
+
+    def _json_loads(data: str | bytes) -> Any:
+        return _orjson.loads(data)
+else:
+    def _json_dumps(obj: Any, *, sort_keys: bool = False, default=None) -> str:
+        # Compact separators match orjson's output and keep the argv
+        # payload small (argv has a hard byte cap).
+        return json.dumps(
+            obj, sort_keys=sort_keys, default=default, separators=(",", ":")
+        )
+
+    def _json_loads(data: str | bytes) -> Any:
+        return json.loads(data)
+
 
-@dataclass
+@dataclass(slots=True)
 class UpskillConfig:
     """Configuration for the upskill bridge."""
 
@@ -40,6 +87,16 @@ class UpskillConfig:
     skills_dir: str = "./skills"
     runs_dir: str = "./runs"
     max_refine_attempts: int = 3
+    use_cache: bool = True
+    _skills_path: Path = field(init=False, repr=False)
+    _skills_parent_str: str = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Derived once: every subprocess call needs the skills parent as
+        # cwd and every skill lookup joins onto the skills dir, so the
+        # Path work shouldn't repeat per request.
+        self._skills_path = Path(self.skills_dir)
+        self._skills_parent_str = str(self._skills_path.parent)
 
     @classmethod
     def from_env(cls) -> "UpskillConfig":
@@ -50,10 +107,11 @@ class UpskillConfig:
             skills_dir=os.getenv("UPSKILL_SKILLS_DIR", "./skills"),
             runs_dir=os.getenv("UPSKILL_RUNS_DIR", "./runs"),
             max_refine_attempts=int(os.getenv("UPSKILL_MAX_REFINE", "3")),
+            use_cache=os.getenv("UPSKILL_USE_CACHE", "1") != "0",
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class EvalResult:
     """Result of an upskill evaluation."""
 
@@ -65,13 +123,171 @@ class EvalResult:
     details: list[dict[str, Any]] = field(default_factory=list)
 
 
+# Rendered skill context, shared across bridge instances. SKILL_REGISTRY
+# is frozen at import, so the context is a constant; building it lazily on
+# first use keeps import cheap while every later _enrich_task call is a
+# string reference instead of a full registry re-render.
+_SKILL_CONTEXT_CACHE: str | None = None
+
+# Fixed Markdown scaffolding around the per-skill blocks in the teacher
+# context; only the skill blocks vary with the registry.
+_CONTEXT_HEADER = "\n".join([
+    "## NeoExcelPPT S-Expression Skill System",
+    "",
+    "### Skill Format",
+    "```",
+    "(define-skill :skill-id",
+    "  (inputs :channel1 :channel2)",
+    "  (outputs :output1 :output2)",
+    "  (state {:key value})",
+    "  (compute",
+    "    (expression)))",
+    "```",
+    "",
+    "### Existing Skills",
+])
+
+_CONTEXT_FOOTER = "\n".join([
+    "",
+    "### Wiring Format",
+    "```",
+    "(define-wiring",
+    "  (connect :skill1:output -> :skill2:input))",
+    "```",
+    "",
+    "### Compute Expressions",
+    "- (get state :key) / (get input :channel)",
+    "- (set :key value) / (emit :channel value)",
+    "- (+ a b) (- a b) (* a b) (/ a b)",
+    "- (let [bindings] body) / (if cond then else)",
+    "- (sum list) / (count list) / (map fn list)",
+])
+
+# Rendered S-expression per registry skill, filled on first use. The
+# context builder, test-case builder, and generation simulator all need
+# the same renders; one shared cache means each skill is serialized once
+# per process.
+_SKILL_SEXPR_CACHE: dict[str, str] = {}
+
+
+# Fixed SKILL.md fragments, joined with the two variable fields in
+# _generate_skill_md instead of re-assembling the template per call.
+_SKILL_MD_PRE_NAME = "# Skill: "
+_SKILL_MD_PRE_TASK = "\n\n## Task\n"
+_SKILL_MD_PRE_SEXPR = "\n\n## S-Expression Definition\n```sexpr\n"
+_SKILL_MD_POST = """
+```
+
+## Usage
+This skill was generated for the NeoExcelPPT system.
+It processes inputs and emits outputs as defined in the S-expression above.
+
+## Evaluation
+Run `upskill eval` with test cases to measure skill lift and token savings.
+"""
+
+
+# Inverted index: id word -> skill ids containing it, built once so task
+# matching is one dict hit per task word instead of re-splitting every
+# skill id per call.
+_SKILL_WORD_INDEX: dict[str, tuple[str, ...]] = {}
+for _sid in SKILL_REGISTRY:
+    for _word in _sid.split('-'):
+        _SKILL_WORD_INDEX[_word] = _SKILL_WORD_INDEX.get(_word, ()) + (_sid,)
+del _sid, _word
+
+# All index words as one alternation (longest first so e.g. a compound
+# word wins over its prefix): the whole task is scanned in a single
+# C-level regex pass instead of tokenizing and probing the index per word.
+_SKILL_WORD_RE = re.compile(
+    r"\b(" + "|".join(
+        re.escape(word)
+        for word in sorted(_SKILL_WORD_INDEX, key=len, reverse=True)
+    ) + r")\b"
+)
+
+
+def _skill_sexpr(generator: SExprGenerator, skill_id: str,
+                 skill_def: dict[str, Any]) -> str:
+    """Rendered S-expression for a registry skill, cached by id."""
+    sexpr = _SKILL_SEXPR_CACHE.get(skill_id)
+    if sexpr is None:
+        sexpr = generator.generate_from_skill_definition(skill_def)
+        _SKILL_SEXPR_CACHE[skill_id] = sexpr
+    return sexpr
+
+
+# Keywords every simulated skill is expected to contain structurally.
+_STRUCTURE_KEYWORDS = frozenset({"define-skill", "inputs", "outputs"})
+
+# Below this many test cases the thread-pool spin-up costs more than the
+# sequential loop it would replace.
+_PARALLEL_EVAL_MIN = 16
+
+# Metric lines in upskill eval output, e.g. "skill_lift: 0.42" or
+# "savings: 31%". One compiled pattern replaces the per-line
+# lowercase/split/float-probe loop.
+_METRIC_RE = re.compile(
+    r"(skill_lift|lift|token_savings|savings)\s*[:=]\s*(-?[\d.]+)%?",
+    re.IGNORECASE,
+)
+_BENEFICIAL_RE = re.compile(r"beneficial[^a-z]*(?:true|yes)", re.IGNORECASE)
+_METRIC_KEY = {
+    "skill_lift": "skill_lift",
+    "lift": "skill_lift",
+    "token_savings": "token_savings",
+    "savings": "token_savings",
+}
+
+
+def _metrics_complete_handler():
+    """Stateful line handler: returns True once all eval metrics appeared.
+
+    Passed to _execute_command so an eval run can stop as soon as
+    skill_lift, token_savings, and the beneficial flag have all been
+    reported, instead of waiting out the rest of the output.
+    """
+    seen: set[str] = set()
+
+    def handler(line: str) -> bool:
+        for match in _METRIC_RE.finditer(line):
+            seen.add(_METRIC_KEY[match.group(1).lower()])
+        if _BENEFICIAL_RE.search(line):
+            seen.add("is_beneficial")
+        return len(seen) == 3
+
+    return handler
+
+
+def _token_matcher(tokens: frozenset[str]):
+    """Build hits(text) -> set of tokens found as substrings of text.
+
+    With pyahocorasick installed this is one automaton pass per string
+    regardless of token count; otherwise it falls back to a per-token
+    substring scan over the same frozen token set.
+    """
+    if _ahocorasick is not None:
+        automaton = _ahocorasick.Automaton()
+        for token in tokens:
+            automaton.add_word(token, token)
+        automaton.make_automaton()
+        return lambda text: {match for _, match in automaton.iter(text)}
+    return lambda text: {token for token in tokens if token in text}
+
+
+@lru_cache(maxsize=1)
 def _upskill_available() -> bool:
-    """Check if the upskill CLI is installed and accessible."""
+    """Check if the upskill CLI is installed and accessible.
+
+    Cached: shutil.which walks PATH on every call, and neither PATH nor
+    the installed CLI changes mid-process.
+    """
     return shutil.which("upskill") is not None
 
 
+@lru_cache(maxsize=1)
 def _api_keys_available() -> bool:
-    """Check if API keys are configured for model access."""
+    """Check if API keys are configured for model access (cached)."""
     return bool(
         os.getenv("ANTHROPIC_API_KEY")
         or os.getenv("OPENAI_API_KEY")
@@ -103,6 +319,13 @@ class UpskillBridge:
         print(results["is_beneficial"])
     """
 
+    # S-expression tools shared by all bridge instances: they carry only
+    # caches, so one of each per process keeps those caches warm instead
+    # of rebuilding them per construction.
+    _shared_parser: SExprParser | None = None
+    _shared_generator: SExprGenerator | None = None
+    _shared_evaluator: SExprEvaluator | None = None
+
     def __init__(
         self,
         teacher_model: str = "sonnet",
@@ -113,10 +336,20 @@ class UpskillBridge:
             teacher_model=teacher_model,
             student_model=student_model,
         )
-        self.parser = SExprParser()
-        self.generator = SExprGenerator()
-        self.evaluator = SExprEvaluator()
-        self._upskill_installed = _upskill_available()
+        cls = type(self)
+        if cls._shared_parser is None:
+            cls._shared_parser = SExprParser()
+            cls._shared_generator = SExprGenerator()
+            cls._shared_evaluator = SExprEvaluator()
+        self.parser = cls._shared_parser
+        self.generator = cls._shared_generator
+        self.evaluator = cls._shared_evaluator
+        # The in-process API works without the CLI on PATH; paths that can
+        # only spawn the binary must check _cli_installed instead.
+        self._cli_installed = _upskill_available()
+        self._upskill_installed = (
+            _upskill_generate is not None or self._cli_installed
+        )
         self._has_api_keys = _api_keys_available()
 
     @property
@@ -164,11 +397,39 @@ class UpskillBridge:
 
         # Try live execution
         if self._upskill_installed and self._has_api_keys:
+            # Same task, examples, and config mean the same teacher call;
+            # serve the stored result instead of re-invoking the model.
+            cache_key = (
+                self._cache_key({"kind": "generate", "cmd": cmd,
+                                 "examples": examples or []})
+                if self.config.use_cache
+                else None
+            )
+            cached = self._cache_load(cache_key)
+            if cached is not None:
+                return cached
+            if _upskill_generate is not None:
+                try:
+                    result["api_result"] = _upskill_generate(
+                        task=enriched_task,
+                        model=self.config.teacher_model,
+                        eval_model=self.config.student_model,
+                        examples=examples or [],
+                        from_trace=from_trace,
+                    )
+                    result["status"] = "executed"
+                    self._cache_store(cache_key, result)
+                except Exception as e:
+                    result["status"] = "error"
+                    result["stderr"] = str(e)
+                return result
             exec_result = self._execute_command(cmd)
             result["status"] = "executed" if exec_result["success"] else "error"
             result["stdout"] = exec_result.get("stdout", "")
             result["stderr"] = exec_result.get("stderr", "")
             result["exit_code"] = exec_result.get("exit_code")
+            if exec_result["success"]:
+                self._cache_store(cache_key, result)
         else:
             # Simulation: generate a skill locally
             sim = self._simulate_generation(task, examples)
@@ -179,6 +440,87 @@ class UpskillBridge:
 
         return result
 
+    def generate_skills_batch(self, tasks: list[str]) -> list[dict[str, Any]]:
+        """Generate several skills at once.
+
+        In live mode the CLI commands for all tasks are built up front
+        and executed concurrently, so N pending generations cost roughly
+        one round of CLI startup plus model latency. Simulation mode is
+        local compute and simply loops.
+
+        Args:
+            tasks: Task descriptions, one per skill to generate.
+
+        Returns:
+            One result dict per task, in order, shaped like
+            generate_skill() output.
+        """
+        # The concurrent path below spawns the CLI; without the binary on
+        # PATH, loop through generate_skill, which can still serve each
+        # task via the in-process API (or simulation).
+        if not (self._cli_installed and self._has_api_keys):
+            return [self.generate_skill(task) for task in tasks]
+
+        results: list[dict[str, Any]] = []
+        cmds: list[list[str]] = []
+        for task in tasks:
+            enriched_task = self._enrich_task(task)
+            cmd = self._build_generate_command(enriched_task, None, None)
+            cmds.append(cmd)
+            results.append({
+                "name": self._task_to_name(task),
+                "command": cmd,
+                "enriched_task": enriched_task,
+                "config": {
+                    "teacher": self.config.teacher_model,
+                    "student": self.config.student_model,
+                },
+                "examples": [],
+            })
+
+        for result, exec_result in zip(results, self._execute_commands_parallel(cmds)):
+            result["status"] = "executed" if exec_result["success"] else "error"
+            result["stdout"] = exec_result.get("stdout", "")
+            result["stderr"] = exec_result.get("stderr", "")
+            result["exit_code"] = exec_result.get("exit_code")
+        return results
+
+    def generate_and_evaluate_batch(
+        self,
+        tasks_and_tests: list[tuple[str, list[dict[str, Any]]]],
+    ) -> list[dict[str, Any]]:
+        """Generate and evaluate a batch of skills as a pipeline.
+
+        All generations are submitted to a thread pool up front and each
+        skill's evaluation is submitted as soon as its generation
+        finishes, so evaluating skill k overlaps with generating skill
+        k+1 instead of running the two phases serially.
+
+        Args:
+            tasks_and_tests: (task, test_cases) pairs, one per skill.
+
+        Returns:
+            One {"skill": ..., "evaluation": ...} dict per pair, in order.
+        """
+        if not tasks_and_tests:
+            return []
+        workers = min(8, max(2, len(tasks_and_tests)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            gen_futures = [
+                executor.submit(self.generate_skill, task)
+                for task, _ in tasks_and_tests
+            ]
+            eval_pairs = []
+            for gen_future, (_, tests) in zip(gen_futures, tasks_and_tests):
+                skill = gen_future.result()
+                eval_pairs.append(
+                    (skill, executor.submit(self.evaluate_skill, skill, tests))
+                )
+            return [
+                {"skill": skill, "evaluation": eval_future.result()}
+                for skill, eval_future in eval_pairs
+            ]
+
     def evaluate_skill(
         self,
         skill: dict[str, Any],
@@ -199,10 +541,7 @@ class UpskillBridge:
         """
         validated_tests = self._validate_test_cases(test_cases)
 
-        skill_path = os.path.join(
-            self.config.skills_dir,
-            skill.get("name", "unknown"),
-        )
+        skill_path = str(self.config._skills_path / skill.get("name", "unknown"))
         cmd = [
             "upskill", "eval", skill_path,
             "--model", self.config.student_model,
@@ -210,8 +549,43 @@ class UpskillBridge:
 
         # Try live execution
         if self._upskill_installed and self._has_api_keys:
-            exec_result = self._execute_command(cmd)
-            return {
+            # The key must cover the skill's *content*, not just its path:
+            # the generate -> eval -> refine -> eval loop reuses the name,
+            # and a stale hit would serve the first eval forever.
+            cache_key = (
+                self._cache_key({"kind": "eval", "cmd": cmd,
+                                 "tests": validated_tests,
+                                 "skill_src": self._skill_source(skill, skill_path)})
+                if self.config.use_cache
+                else None
+            )
+            cached = self._cache_load(cache_key)
+            if cached is not None:
+                return cached
+            if _upskill_evaluate is not None:
+                result = {
+                    "command": cmd,
+                    "test_cases": validated_tests,
+                }
+                try:
+                    api_result = _upskill_evaluate(
+                        skill_path,
+                        model=self.config.student_model,
+                    )
+                    result["status"] = "executed"
+                    if isinstance(api_result, dict):
+                        result.update(api_result)
+                    else:
+                        result["api_result"] = api_result
+                    self._cache_store(cache_key, result)
+                except Exception as e:
+                    result["status"] = "error"
+                    result["stderr"] = str(e)
+                return result
+            exec_result = self._execute_command(
+                cmd, line_handler=_metrics_complete_handler()
+            )
+            result = {
                 "command": cmd,
                 "test_cases": validated_tests,
                 "status": "executed" if exec_result["success"] else "error",
@@ -219,6 +593,9 @@ class UpskillBridge:
                 "stderr": exec_result.get("stderr", ""),
                 **self._parse_eval_output(exec_result.get("stdout", "")),
             }
+            if exec_result["success"]:
+                self._cache_store(cache_key, result)
+            return result
 
         # Simulation: evaluate locally using S-expression tools
         sim_results = self._simulate_evaluation(skill, validated_tests)
@@ -260,7 +637,7 @@ class UpskillBridge:
             })
 
             # Test: can the model describe what this skill does?
-            sexpr = self.generator.generate_from_skill_definition(skill_def)
+            sexpr = _skill_sexpr(self.generator, skill_id, skill_def)
             test_cases.append({
                 "input": f"Explain what this S-expression skill does:\n{sexpr}",
                 "expected": {
@@ -298,45 +675,36 @@ class UpskillBridge:
 
         This is included in the upskill generation prompt to give the
         teacher model full context about our S-expression vocabulary.
+        The registry never mutates at runtime, so the rendered string is
+        built once and reused by every bridge instance.
         """
-        lines = [
-            "## NeoExcelPPT S-Expression Skill System",
-            "",
-            "### Skill Format",
-            "```",
-            "(define-skill :skill-id",
-            "  (inputs :channel1 :channel2)",
-            "  (outputs :output1 :output2)",
-            "  (state {:key value})",
-            "  (compute",
-            "    (expression)))",
-            "```",
-            "",
-            "### Existing Skills",
-        ]
+        global _SKILL_CONTEXT_CACHE
+        if _SKILL_CONTEXT_CACHE is not None:
+            return _SKILL_CONTEXT_CACHE
+
+        # Two blocks per skill, filled by index into a right-sized list
+        # so the cold render never regrows its backing array.
+        skill_blocks: list[str] = [""] * (2 * len(SKILL_REGISTRY))
+        for i, (skill_id, skill_def) in enumerate(SKILL_REGISTRY.items()):
+            sexpr = _skill_sexpr(self.generator, skill_id, skill_def)
+            skill_blocks[2 * i] = f"\n#### {skill_def['name']}"
+            skill_blocks[2 * i + 1] = f"```\n{sexpr}\n```"
+
+        _SKILL_CONTEXT_CACHE = "\n".join(
+            (_CONTEXT_HEADER, *skill_blocks, _CONTEXT_FOOTER)
+        )
+        return _SKILL_CONTEXT_CACHE
+
+    @classmethod
+    def invalidate_context_cache(cls) -> None:
+        """Drop the cached context and per-skill renders.
 
-        for skill_def in SKILL_REGISTRY.values():
-            sexpr = self.generator.generate_from_skill_definition(skill_def)
-            lines.append(f"\n#### {skill_def['name']}")
-            lines.append(f"```\n{sexpr}\n```")
-
-        lines.extend([
-            "",
-            "### Wiring Format",
-            "```",
-            "(define-wiring",
-            "  (connect :skill1:output -> :skill2:input))",
-            "```",
-            "",
-            "### Compute Expressions",
-            "- (get state :key) / (get input :channel)",
-            "- (set :key value) / (emit :channel value)",
-            "- (+ a b) (- a b) (* a b) (/ a b)",
-            "- (let [bindings] body) / (if cond then else)",
-            "- (sum list) / (count list) / (map fn list)",
-        ])
-
-        return "\n".join(lines)
+        The registry is frozen in normal operation; this hook exists for
+        tests that patch skill definitions and need a fresh render.
+        """
+        global _SKILL_CONTEXT_CACHE
+        _SKILL_CONTEXT_CACHE = None
+        _SKILL_SEXPR_CACHE.clear()
 
     def refine_skill(
         self,
@@ -355,13 +723,12 @@ class UpskillBridge:
             Refined skill dict
         """
         attempts = max_attempts or self.config.max_refine_attempts
+        refine_task = f"Refine this skill: {feedback}"
+        skill_path = str(self.config._skills_path / skill.get("name", "unknown"))
         cmd = [
             "upskill", "generate",
-            f"Refine this skill: {feedback}",
-            "--from", os.path.join(
-                self.config.skills_dir,
-                skill.get("name", "unknown"),
-            ),
+            refine_task,
+            "--from", skill_path,
             "--model", self.config.teacher_model,
         ]
 
@@ -373,6 +740,20 @@ class UpskillBridge:
         }
 
         if self._upskill_installed and self._has_api_keys:
+            if _upskill_generate is not None:
+                try:
+                    result["api_result"] = _upskill_generate(
+                        task=refine_task,
+                        model=self.config.teacher_model,
+                        eval_model=self.config.student_model,
+                        examples=[],
+                        from_trace=skill_path,
+                    )
+                    result["status"] = "executed"
+                except Exception as e:
+                    result["status"] = "error"
+                    result["stderr"] = str(e)
+                return result
             exec_result = self._execute_command(cmd)
             result["status"] = "executed" if exec_result["success"] else "error"
             result["stdout"] = exec_result.get("stdout", "")
@@ -404,33 +785,38 @@ class UpskillBridge:
             cmd.extend(["--eval-model", self.config.student_model])
         if examples:
             for ex in examples:
-                cmd.extend(["-e", json.dumps(ex)])
+                cmd.extend(["-e", _json_dumps(ex)])
         if from_trace:
             cmd.extend(["--from", from_trace])
         return cmd
 
     def _execute_command(
-        self, cmd: list[str], timeout: int = 120
+        self,
+        cmd: list[str],
+        timeout: int = 120,
+        line_handler=None,
     ) -> dict[str, Any]:
-        """Execute an upskill CLI command via subprocess.
+        """Execute an upskill CLI command, streaming its output.
+
+        stdout is consumed line by line as it arrives instead of being
+        buffered whole by capture_output; stderr drains on a side thread
+        so neither pipe can deadlock. An optional ``line_handler`` sees
+        each stdout line and may return True to stop the process early
+        (e.g. once all eval metrics have been reported); an early stop
+        still counts as success.
 
         Returns:
             {"success": bool, "stdout": str, "stderr": str, "exit_code": int}
         """
         try:
-            proc = subprocess.run(
+            proc = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
-                timeout=timeout,
-                cwd=str(Path(self.config.skills_dir).parent),
+                bufsize=1,
+                cwd=self.config._skills_parent_str,
             )
-            return {
-                "success": proc.returncode == 0,
-                "stdout": proc.stdout,
-                "stderr": proc.stderr,
-                "exit_code": proc.returncode,
-            }
         except FileNotFoundError:
             return {
                 "success": False,
@@ -438,46 +824,155 @@ class UpskillBridge:
                 "stderr": "upskill command not found. Install with: pip install upskill",
                 "exit_code": -1,
             }
-        except subprocess.TimeoutExpired:
+        except Exception as e:
             return {
                 "success": False,
                 "stdout": "",
-                "stderr": f"Command timed out after {timeout}s",
-                "exit_code": -2,
+                "stderr": str(e),
+                "exit_code": -3,
             }
+
+        stderr_lines: list[str] = []
+        drain = threading.Thread(
+            target=lambda: stderr_lines.extend(proc.stderr), daemon=True
+        )
+        drain.start()
+
+        # Watchdog covers silent hangs that never produce a line.
+        timed_out = threading.Event()
+
+        def _kill_on_timeout() -> None:
+            timed_out.set()
+            proc.kill()
+
+        watchdog = threading.Timer(timeout, _kill_on_timeout)
+        watchdog.start()
+
+        stdout_lines: list[str] = []
+        stopped_early = False
+        try:
+            for line in proc.stdout:
+                stdout_lines.append(line)
+                if line_handler is not None and line_handler(line):
+                    stopped_early = True
+                    proc.terminate()
+                    break
+            proc.wait()
         except Exception as e:
+            proc.kill()
+            proc.wait()
             return {
                 "success": False,
                 "stdout": "",
                 "stderr": str(e),
                 "exit_code": -3,
             }
+        finally:
+            watchdog.cancel()
+            drain.join(timeout=5)
+
+        if timed_out.is_set():
+            return {
+                "success": False,
+                "stdout": "",
+                "stderr": f"Command timed out after {timeout}s",
+                "exit_code": -2,
+            }
+        return {
+            "success": stopped_early or proc.returncode == 0,
+            "stdout": "".join(stdout_lines),
+            "stderr": "".join(stderr_lines),
+            "exit_code": proc.returncode,
+        }
+
+    def _cache_key(self, payload: dict[str, Any]) -> str:
+        """Stable hash for a live-mode request (command, inputs, config)."""
+        canonical = _json_dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+    def _skill_source(self, skill: dict[str, Any], skill_path: str) -> str:
+        """Best-effort skill content for cache keying.
+
+        Prefers the generated content carried on the skill dict, then the
+        SKILL.md / S-expression materialized at ``skill_path``. Empty when
+        nothing exists yet; the key still covers command and tests.
+        """
+        for field_name in ("simulated_skill", "stdout"):
+            src = skill.get(field_name)
+            if src:
+                return src
+        path = Path(skill_path)
+        try:
+            if path.is_dir():
+                path = path / "SKILL.md"
+            return path.read_text()
+        except OSError:
+            return ""
+
+    def _cache_path(self, key: str) -> Path:
+        return Path(self.config.runs_dir) / "cache" / f"{key}.json"
+
+    def _cache_load(self, key: str | None) -> dict[str, Any] | None:
+        """Best-effort cached result lookup; misses and IO errors return None."""
+        if key is None:
+            return None
+        try:
+            with open(self._cache_path(key)) as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+
+    def _cache_store(self, key: str | None, result: dict[str, Any]) -> None:
+        """Best-effort cache write; a failed write never fails the request."""
+        if key is None:
+            return
+        path = self._cache_path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            with open(tmp, "w") as f:
+                f.write(_json_dumps(result))
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            # TypeError/ValueError: result payloads from the in-process API
+            # may hold objects json can't serialize; skip caching those.
+            pass
+
+    def _execute_commands_parallel(
+        self, cmds: list[list[str]], timeout: int = 120
+    ) -> list[dict[str, Any]]:
+        """Run several upskill CLI commands concurrently.
+
+        Each invocation is dominated by CLI startup and model latency,
+        and subprocess waits release the GIL, so pending commands share
+        a thread pool instead of paying those costs serially.
+        """
+        if len(cmds) == 1:
+            return [self._execute_command(cmds[0], timeout=timeout)]
+        with ThreadPoolExecutor(max_workers=min(8, len(cmds))) as executor:
+            return list(
+                executor.map(partial(self._execute_command, timeout=timeout), cmds)
+            )
 
     def _parse_eval_output(self, stdout: str) -> dict[str, Any]:
-        """Parse upskill eval output to extract metrics."""
+        """Parse upskill eval output to extract metrics.
+
+        One _METRIC_RE pass over the whole output instead of a
+        per-line split-and-float-probe loop; a repeated metric keeps
+        its last reported value, matching the line scan it replaces.
+        """
         result: dict[str, Any] = {
             "skill_lift": 0.0,
             "token_savings": 0.0,
             "is_beneficial": False,
         }
-        for line in stdout.splitlines():
-            lower = line.lower().strip()
-            if "skill_lift" in lower or "lift:" in lower:
-                for word in lower.split():
-                    try:
-                        result["skill_lift"] = float(word.strip('%'))
-                        break
-                    except ValueError:
-                        continue
-            if "token_savings" in lower or "savings:" in lower:
-                for word in lower.split():
-                    try:
-                        result["token_savings"] = float(word.strip('%'))
-                        break
-                    except ValueError:
-                        continue
-            if "beneficial" in lower and ("true" in lower or "yes" in lower):
-                result["is_beneficial"] = True
+        for match in _METRIC_RE.finditer(stdout):
+            try:
+                result[_METRIC_KEY[match.group(1).lower()]] = float(match.group(2))
+            except ValueError:
+                continue
+        if _BENEFICIAL_RE.search(stdout):
+            result["is_beneficial"] = True
         return result
 
     # =========================================================================
@@ -492,16 +987,19 @@ class UpskillBridge:
         Uses pattern matching against existing skills to produce
         a reasonable skill definition from the task description.
         """
-        # Try to match task to an existing skill
-        task_lower = task.lower()
-        matched_skill = None
-        for skill_id, skill_def in SKILL_REGISTRY.items():
-            if any(word in task_lower for word in skill_id.split('-')):
-                matched_skill = skill_def
-                break
+        # Try to match task to an existing skill: one regex pass over the
+        # task collects the index words it mentions, then the first match
+        # in registry order wins as before.
+        candidates = {
+            sid
+            for match in _SKILL_WORD_RE.finditer(task.lower())
+            for sid in _SKILL_WORD_INDEX[match.group(1)]
+        }
+        matched_id = next((sid for sid in SKILL_REGISTRY if sid in candidates), None)
+        matched_skill = SKILL_REGISTRY[matched_id] if matched_id else None
 
         if matched_skill:
-            sexpr = self.generator.generate_from_skill_definition(matched_skill)
+            sexpr = _skill_sexpr(self.generator, matched_id, matched_skill)
             note = f"Matched existing skill '{matched_skill['id']}' from registry."
         elif examples:
             # Use the first example's output if it looks like an S-expression
@@ -529,11 +1027,17 @@ class UpskillBridge:
         self,
         skill: dict[str, Any],
         test_cases: list[dict[str, Any]],
+        short_circuit: bool = False,
     ) -> dict[str, Any]:
         """Simulate evaluation using local S-expression validation.
 
         Actually runs the test cases by checking if generated S-expressions
         parse correctly and contain expected tokens.
+
+        With ``short_circuit`` set, test cases are evaluated sequentially
+        and the loop stops as soon as the pass-count bounds pin down
+        is_beneficial either way — for callers (CI gating) that only care
+        about the boolean. Metrics then cover the evaluated prefix only.
         """
         # Get the skill's S-expression (from simulated generation or examples)
         skill_sexpr = skill.get("simulated_skill", "")
@@ -541,62 +1045,97 @@ class UpskillBridge:
             skill_sexpr = skill["examples"][0].get("output", "")
 
         total = len(test_cases)
-        passed = 0
-        details: list[dict[str, Any]] = []
 
-        for tc in test_cases:
-            tc_input = tc.get("input", "")
-            expected = tc.get("expected", {})
-            contains = expected.get("contains", [])
-
-            # Check 1: Does the skill S-expression contain expected tokens?
-            content_to_check = skill_sexpr + " " + tc_input
-            token_hits = sum(
-                1 for token in contains
-                if token in content_to_check
+        # One matcher over the union of all expected tokens plus the
+        # structure keywords: each content string is scanned once instead
+        # of once per token per check.
+        all_tokens = frozenset(
+            token
+            for tc in test_cases
+            for token in tc.get("expected", {}).get("contains", [])
+        ) | _STRUCTURE_KEYWORDS
+        hits_of = _token_matcher(all_tokens)
+
+        # skill_sexpr does not change across test cases, so parse it and
+        # scan it for token hits once; each case then only scans its own
+        # input instead of a fresh skill+input concatenation.
+        if skill_sexpr:
+            parses = self.parser.parse(skill_sexpr).get("valid", False)
+            sexpr_hits = hits_of(skill_sexpr)
+            has_structure = _STRUCTURE_KEYWORDS <= sexpr_hits
+        else:
+            parses = False
+            sexpr_hits = frozenset()
+            has_structure = False
+
+        # Token savings only needs skill_sexpr, so it is known before any
+        # test runs (and can decide is_beneficial early below). The
+        # wrapper json.dumps({"skill": s}, indent=2) adds a constant 17
+        # chars plus one char per escaped quote/backslash/newline, so
+        # the size is computed analytically instead of serializing the
+        # whole string just to measure it.
+        if skill_sexpr:
+            escapes = (
+                skill_sexpr.count('"')
+                + skill_sexpr.count('\\')
+                + skill_sexpr.count('\n')
             )
-            token_score = token_hits / max(len(contains), 1)
-
-            # Check 2: Is the skill S-expression parseable?
-            if skill_sexpr:
-                parse_result = self.parser.parse(skill_sexpr)
-                parses = parse_result.get("valid", False)
-            else:
-                parses = False
-
-            # Check 3: Does it have the right structure?
-            has_structure = all(
-                kw in skill_sexpr
-                for kw in ["define-skill", "inputs", "outputs"]
-            ) if skill_sexpr else False
-
-            tc_passed = token_score >= 0.5 and parses
-            if tc_passed:
-                passed += 1
-
-            details.append({
-                "input": tc_input[:100],
-                "passed": tc_passed,
-                "token_score": token_score,
-                "parses": parses,
-                "has_structure": has_structure,
-            })
+            json_size = len(skill_sexpr) + escapes + 17
+            sexpr_size = len(skill_sexpr)
+            token_savings = (json_size - sexpr_size) / max(json_size, 1)
+        else:
+            token_savings = 0.0
 
-        # Calculate metrics
-        pass_rate = passed / max(total, 1)
         # Simulate baseline (without skill) as 30% pass rate
         baseline_rate = 0.3
-        skill_lift = (pass_rate - baseline_rate) / max(baseline_rate, 0.01)
 
-        # Token savings: compare S-expression size to JSON equivalent
-        if skill_sexpr:
-            json_size = len(json.dumps({"skill": skill_sexpr}, indent=2))
-            sexpr_size = len(skill_sexpr)
-            token_savings = (json_size - sexpr_size) / max(json_size, 1)
+        def beneficial_at(lift: float) -> bool:
+            return lift > 0.05 or (lift >= 0 and token_savings > 0.2)
+
+        # Test cases are independent; large batches fan out over threads
+        # (same pattern as the interpreter's parallel section scan).
+        evaluate_one = partial(
+            self._evaluate_one,
+            sexpr_hits=sexpr_hits,
+            parses=parses,
+            has_structure=has_structure,
+            hits_of=hits_of,
+        )
+        decided: bool | None = None
+        if short_circuit:
+            # The final lift is bounded by the lift if every remaining
+            # case passed (upper) or failed (lower), and is_beneficial is
+            # monotone in lift; stop once both bounds agree.
+            details = []
+            passed = 0
+            for evaluated, tc in enumerate(test_cases, 1):
+                detail = evaluate_one(tc)
+                details.append(detail)
+                passed += detail["passed"]
+                lift_lo = (passed / total - baseline_rate) / baseline_rate
+                lift_hi = (
+                    (passed + total - evaluated) / total - baseline_rate
+                ) / baseline_rate
+                if beneficial_at(lift_lo):
+                    decided = True
+                    break
+                if not beneficial_at(lift_hi):
+                    decided = False
+                    break
+        elif total >= _PARALLEL_EVAL_MIN:
+            with ThreadPoolExecutor(max_workers=min(32, total)) as executor:
+                details = list(executor.map(evaluate_one, test_cases))
+            passed = sum(1 for detail in details if detail["passed"])
         else:
-            token_savings = 0.0
+            details = [evaluate_one(tc) for tc in test_cases]
+            passed = sum(1 for detail in details if detail["passed"])
+
+        # Calculate metrics (over the evaluated prefix when short-circuited)
+        evaluated = len(details) if short_circuit else total
+        pass_rate = passed / max(evaluated, 1)
+        skill_lift = (pass_rate - baseline_rate) / max(baseline_rate, 0.01)
 
-        is_beneficial = (skill_lift > 0.05) or (skill_lift >= 0 and token_savings > 0.2)
+        is_beneficial = decided if decided is not None else beneficial_at(skill_lift)
 
         return {
             "skill_lift": round(skill_lift, 3),
@@ -613,6 +1152,32 @@ class UpskillBridge:
             ),
         }
 
+    def _evaluate_one(
+        self,
+        tc: dict[str, Any],
+        sexpr_hits: frozenset[str],
+        parses: bool,
+        has_structure: bool,
+        hits_of,
+    ) -> dict[str, Any]:
+        """Evaluate a single simulated test case; returns its detail dict."""
+        tc_input = tc.get("input", "")
+        contains = tc.get("expected", {}).get("contains", [])
+
+        # Do the skill S-expression or the test input contain the
+        # expected tokens? The skill-side hits were scanned once by the
+        # caller; only the input is scanned here.
+        hits = sexpr_hits | hits_of(tc_input)
+        token_score = len(hits.intersection(contains)) / max(len(contains), 1)
+
+        return {
+            "input": tc_input[:100],
+            "passed": token_score >= 0.5 and parses,
+            "token_score": token_score,
+            "parses": parses,
+            "has_structure": has_structure,
+        }
+
     def _generate_stub_skill(self, task: str) -> str:
         """Generate a stub S-expression skill from a task description."""
         # Extract keywords for naming
@@ -630,23 +1195,12 @@ class UpskillBridge:
 
     def _generate_skill_md(self, task: str, sexpr: str) -> str:
         """Generate a SKILL.md document for the skill."""
-        return f"""# Skill: {self._task_to_name(task)}
-
-## Task
-{task}
-
-## S-Expression Definition
-```sexpr
-{sexpr}
-```
-
-## Usage
-This skill was generated for the NeoExcelPPT system.
-It processes inputs and emits outputs as defined in the S-expression above.
-
-## Evaluation
-Run `upskill eval` with test cases to measure skill lift and token savings.
-"""
+        return "".join((
+            _SKILL_MD_PRE_NAME, self._task_to_name(task),
+            _SKILL_MD_PRE_TASK, task,
+            _SKILL_MD_PRE_SEXPR, sexpr,
+            _SKILL_MD_POST,
+        ))
 
     # =========================================================================
     # Helpers
@@ -670,11 +1224,32 @@ Run `upskill eval` with test cases to measure skill lift and token savings.
     def _validate_test_cases(
         self, test_cases: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        """Ensure test cases have proper S-expression assertions."""
-        validated = []
+        """Ensure test cases have proper S-expression assertions.
+
+        Patches deficient cases in place and returns the same list — no
+        per-case dict copies. The bridge owns the batches it builds
+        (generate_sexpr_test_cases); external callers only ever see the
+        default contains assertion added to cases that lacked one.
+        """
         for tc in test_cases:
-            expected = tc.get("expected", {})
-            if "contains" not in expected:
+            expected = tc.get("expected")
+            if expected is None:
+                tc["expected"] = {"contains": ["define-skill"]}
+            elif "contains" not in expected:
                 expected["contains"] = ["define-skill"]
-            validated.append({**tc, "expected": expected})
-        return validated
+        return test_cases
+
+
+_shared_bridge: UpskillBridge | None = None
+
+
+def get_shared_bridge() -> UpskillBridge:
+    """Process-wide bridge with default config, built on first use.
+
+    Batched callers that don't need a custom config share one instance
+    (and its warm caches) instead of constructing a bridge per request.
+    """
+    global _shared_bridge
+    if _shared_bridge is None:
+        _shared_bridge = UpskillBridge()
+    return _shared_bridge
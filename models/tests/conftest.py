@@ -0,0 +1,29 @@
+"""Shared test configuration."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add models to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+# Default the parse disk cache off before anything imports models.skills:
+# the package __init__ pulls in skill_definitions, which parses the five
+# registry computes at import time — long before any fixture runs. An
+# explicit NEOEXCELPPT_PARSE_CACHE=1 in the environment still wins.
+os.environ.setdefault("NEOEXCELPPT_PARSE_CACHE", "0")
+
+from models.skills import sexpr_generator
+
+
+@pytest.fixture(autouse=True)
+def _no_parse_disk_cache(monkeypatch):
+    """Keep test runs from writing parse pickles into the user's home cache.
+
+    monkeypatch restores the flag after each test, so TestParseDiskCache
+    can re-enable the cache against a tmp directory without leaking the
+    setting into later tests.
+    """
+    monkeypatch.setattr(sexpr_generator, "_DISK_CACHE_ENABLED", False)
@@ -41,6 +41,9 @@ from models.skills.sexpr_generator import (
 from models.skills.skill_definitions import (
     SKILL_REGISTRY,
     DEFAULT_WIRING,
+    EVALUATION_ORDER,
+    ChangePropagator,
+    run_all,
     get_all_skills,
     get_skill,
     get_skill_ids,
@@ -56,37 +59,40 @@ from models.skills.upskill_bridge import UpskillBridge, UpskillConfig
 # =============================================================================
 
 
-@pytest.fixture
+# Module scope: these objects carry only caches, never per-test state,
+# so one instance serves every test instead of one per test.
+@pytest.fixture(scope="module")
 def parser():
     return SExprParser()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generator():
     return SExprGenerator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def evaluator():
     return SExprEvaluator()
 
 
+# Function scope: tests mutate the wiring via connect()/clear().
 @pytest.fixture
 def wiring():
     return WiringGenerator()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def actions():
     return ActionComposer()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def interpreter():
     return LocalhostInterpreter()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def bridge():
     return UpskillBridge(teacher_model="sonnet", student_model="haiku")
 
@@ -278,13 +284,16 @@ class TestSExprGeneration:
         assert ":dependency-pct" in sexpr
         assert ":learning-pct" in sexpr
 
-    def test_generate_all_registry_skills(self, generator, parser):
-        for skill_id, skill_def in SKILL_REGISTRY.items():
-            sexpr = generator.generate_from_skill_definition(skill_def)
-            assert "(define-skill" in sexpr, f"Missing define-skill in {skill_id}"
-            assert skill_def["id"] in sexpr, f"Missing skill ID in {skill_id}"
-            result = parser.parse(sexpr)
-            assert result["valid"], f"Generated S-expr for {skill_id} doesn't parse: {result.get('error')}"
+    @pytest.mark.parametrize(
+        "skill_id", list(SKILL_REGISTRY), ids=list(SKILL_REGISTRY)
+    )
+    def test_generate_all_registry_skills(self, generator, parser, skill_id):
+        skill_def = SKILL_REGISTRY[skill_id]
+        sexpr = generator.generate_from_skill_definition(skill_def)
+        assert "(define-skill" in sexpr, f"Missing define-skill in {skill_id}"
+        assert skill_def["id"] in sexpr, f"Missing skill ID in {skill_id}"
+        result = parser.parse(sexpr)
+        assert result["valid"], f"Generated S-expr for {skill_id} doesn't parse: {result.get('error')}"
 
     def test_generate_skill_no_compute(self, generator):
         """Skill without compute should still generate valid S-expression."""
@@ -426,6 +435,20 @@ class TestSExprEvaluator:
         )
         assert result.value == 60  # sum works on parsed vectors
 
+    def test_eval_sum_large_list_keeps_filter_semantics(self, evaluator):
+        """Large sums (the vectorized path when numpy is present) must match
+        the plain loop: non-numeric elements ignored, int sums stay int."""
+        result = evaluator.evaluate(
+            "(sum (get input :xs))", inputs={"xs": list(range(200))}
+        )
+        assert result.value == 19900
+        assert type(result.value) is int
+        result = evaluator.evaluate(
+            "(sum (get input :xs))",
+            inputs={"xs": [str(i) for i in range(200)]},
+        )
+        assert result.value == 0
+
     def test_eval_count(self, evaluator):
         result = evaluator.evaluate(
             "(count [1 2 3 4 5])",
@@ -1155,3 +1178,297 @@ class TestEdgeCases:
         result = parser.parse(sexpr)
         assert result["valid"] is True
         assert result["ast"] == ["+", 1, 2]
+
+
+# =============================================================================
+# Test 13: Incremental Change Propagation
+# =============================================================================
+
+
+class TestChangePropagation:
+    """Test the dirty-bit incremental runner over the default wiring."""
+
+    def test_propagate_and_read_emissions(self):
+        cp = ChangePropagator()
+        cp.set_input(":project-scope", ":file-counts",
+                     {"simple": 10, "medium": 5, "complex": 2})
+        ran = cp.tick()
+        assert "project-scope" in ran
+        assert cp.emissions(":project-scope")["total-files"] == 17
+
+    def test_partial_inputs_do_not_crash_tick(self):
+        """A downstream skill missing an input is skipped, not raised."""
+        cp = ChangePropagator()
+        cp.set_input(":project-scope", ":file-counts",
+                     {"simple": 10, "medium": 5, "complex": 2})
+        # component-calculator is dirtied by :total-files but has never
+        # seen :automation-pct; tick must survive that.
+        cp.tick()
+        # Staging the missing input re-dirties it and the chain resumes.
+        cp.set_input(":component-calculator", ":automation-pct", 20)
+        ran = cp.tick()
+        assert "component-calculator" in ran
+        assert cp.emissions(":component-calculator")["scaled-effort"] == 204.0
+
+    def test_full_graph_propagation(self):
+        cp = ChangePropagator()
+        cp.set_input(":project-scope", ":file-counts",
+                     {"simple": 10, "medium": 5, "complex": 2})
+        cp.set_input(":component-calculator", ":automation-pct", 20)
+        cp.set_input(":activity-calculator", ":activity-update",
+                     {"setup": 3.0, "review": 2.0})
+        cp.set_input(":effort-aggregator", ":buffer-days", 0)
+        cp.tick()
+        assert cp.emissions(":activity-calculator")["activity-totals"] == 5.0
+        assert cp.emissions(":effort-aggregator")["total-days"] == 209.0
+        assert cp.emissions(":buffer-calculator")["buffer-days"] == pytest.approx(94.05)
+
+    def test_unchanged_inputs_run_nothing(self):
+        cp = ChangePropagator()
+        counts = {"simple": 10, "medium": 5, "complex": 2}
+        cp.set_input(":project-scope", ":file-counts", counts)
+        cp.tick()
+        assert cp.tick() == []
+        # Re-staging an equal value must not dirty anything.
+        cp.set_input(":project-scope", ":file-counts", dict(counts))
+        assert cp.tick() == []
+
+
+class TestFusedRunAll:
+    """Test the fused run_all pass against the wired evaluator graph."""
+
+    def test_run_all_matches_wired_evaluator(self, evaluator):
+        external = {
+            "project-scope": {"file-counts":
+                              {"simple": 10, "medium": 5, "complex": 2}},
+            "component-calculator": {"automation-pct": 20},
+            "activity-calculator": {"activity-update":
+                                    {"setup": 3.0, "review": 2.0}},
+            "effort-aggregator": {"buffer-days": 0},
+        }
+        emissions: dict[str, dict] = {}
+        for skill_id in EVALUATION_ORDER:
+            skill = SKILL_REGISTRY[skill_id]
+            inputs = dict(external.get(skill_id, {}))
+            for conn in DEFAULT_WIRING:
+                if conn["to_skill"] == skill_id:
+                    inputs[conn["to_channel"]] = (
+                        emissions[conn["from_skill"]][conn["from_channel"]]
+                    )
+            result = evaluator.evaluate(
+                skill["compute"], state=dict(skill["state"]), inputs=inputs
+            )
+            assert result.error is None, f"{skill_id}: {result.error}"
+            emissions[skill_id] = result.emissions
+
+        total_files, scaled, component_days, total_days, buffer_days = run_all(
+            10, 5, 2, automation_pct=20.0, activity_total=5.0
+        )
+        assert total_files == emissions["project-scope"]["total-files"]
+        assert scaled == pytest.approx(
+            emissions["component-calculator"]["scaled-effort"]
+        )
+        assert component_days == pytest.approx(
+            emissions["component-calculator"]["component-days"]
+        )
+        assert total_days == pytest.approx(
+            emissions["effort-aggregator"]["total-days"]
+        )
+        assert buffer_days == pytest.approx(
+            emissions["buffer-calculator"]["buffer-days"]
+        )
+
+    def test_run_all_defaults(self):
+        assert run_all(0, 0, 0) == (0, 0.0, 0.0, 0.0, 0.0)
+
+
+# =============================================================================
+# Test 14: Live-Result Disk Cache
+# =============================================================================
+
+
+class TestLiveResultCache:
+    """Test the bridge's hashed-JSON cache for live generate/eval results."""
+
+    @pytest.fixture
+    def cached_bridge(self, tmp_path):
+        return UpskillBridge(config=UpskillConfig(runs_dir=str(tmp_path)))
+
+    def test_cache_round_trip(self, cached_bridge):
+        key = cached_bridge._cache_key({"kind": "generate", "cmd": ["upskill"]})
+        result = {"name": "adder", "status": "executed", "stdout": "ok"}
+        cached_bridge._cache_store(key, result)
+        assert cached_bridge._cache_load(key) == result
+
+    def test_cache_key_is_stable_and_input_sensitive(self, cached_bridge):
+        payload = {"kind": "generate", "cmd": ["upskill", "generate"]}
+        assert (
+            cached_bridge._cache_key(payload)
+            == cached_bridge._cache_key(dict(payload))
+        )
+        other = cached_bridge._cache_key({"kind": "evaluate", "cmd": []})
+        assert other != cached_bridge._cache_key(payload)
+
+    def test_cache_miss_returns_none(self, cached_bridge):
+        key = cached_bridge._cache_key({"kind": "generate", "cmd": ["never"]})
+        assert cached_bridge._cache_load(key) is None
+        assert cached_bridge._cache_load(None) is None
+
+    def test_unserializable_payload_never_raises(self, cached_bridge):
+        """A result holding a non-JSON object must not fail the request."""
+        key = cached_bridge._cache_key({"kind": "generate", "cmd": ["api"]})
+        cached_bridge._cache_store(key, {"api_result": object()})
+        assert cached_bridge._cache_load(key) is None
+
+    def test_eval_cache_keys_on_skill_content(self, cached_bridge, monkeypatch):
+        """Refining a skill under the same name must miss the old entry."""
+        from models.skills import upskill_bridge
+
+        lifts = iter([0.1, 0.9])
+        monkeypatch.setattr(
+            upskill_bridge, "_upskill_evaluate",
+            lambda *a, **kw: {"skill_lift": next(lifts)},
+        )
+        monkeypatch.setattr(cached_bridge, "_upskill_installed", True)
+        monkeypatch.setattr(cached_bridge, "_has_api_keys", True)
+        tests = [{"input": "x", "expected": {"contains": ["define-skill"]}}]
+
+        first = cached_bridge.evaluate_skill(
+            {"name": "adder", "simulated_skill": "(define-skill :adder-v1)"},
+            tests,
+        )
+        assert first["skill_lift"] == 0.1
+        # Same name, new content: must re-evaluate, not serve the stale hit.
+        second = cached_bridge.evaluate_skill(
+            {"name": "adder", "simulated_skill": "(define-skill :adder-v2)"},
+            tests,
+        )
+        assert second["skill_lift"] == 0.9
+        # Unchanged content is a genuine hit.
+        again = cached_bridge.evaluate_skill(
+            {"name": "adder", "simulated_skill": "(define-skill :adder-v2)"},
+            tests,
+        )
+        assert again["skill_lift"] == 0.9
+
+
+class TestParseDiskCache:
+    """Test the parser's pickled disk cache and its version fallback."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path, monkeypatch):
+        from models.skills import sexpr_generator
+        # The autouse conftest fixture disables the disk cache for the
+        # suite; re-enable it here against a tmp directory.
+        monkeypatch.setattr(sexpr_generator, "_DISK_CACHE_ENABLED", True)
+        monkeypatch.setattr(sexpr_generator, "_DISK_CACHE_DIR", tmp_path)
+        return tmp_path
+
+    def test_disabled_cache_writes_nothing(self, tmp_path, monkeypatch):
+        from models.skills import sexpr_generator
+        monkeypatch.setattr(sexpr_generator, "_DISK_CACHE_DIR", tmp_path)
+        assert sexpr_generator._DISK_CACHE_ENABLED is False
+        sexpr_generator._disk_cache_store("(+ 1 2)", (True, ("+", 1, 2), None))
+        assert sexpr_generator._disk_cache_load("(+ 1 2)") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_disk_cache_round_trip(self, cache_dir):
+        from models.skills.sexpr_generator import (
+            _disk_cache_load,
+            _disk_cache_store,
+        )
+        source = "(+ 1 2)"
+        result = (True, ("+", 1, 2), None)
+        assert _disk_cache_load(source) is None
+        _disk_cache_store(source, result)
+        assert _disk_cache_load(source) == result
+
+    def test_version_mismatch_falls_back_to_miss(self, cache_dir):
+        import hashlib
+        import pickle
+        from models.skills.sexpr_generator import (
+            _PARSE_CACHE_VERSION,
+            _disk_cache_load,
+        )
+        source = "(* 3 4)"
+        path = cache_dir / (
+            hashlib.sha1(source.encode()).hexdigest() + ".pkl"
+        )
+        with open(path, "wb") as f:
+            pickle.dump((_PARSE_CACHE_VERSION + 1, (True, ("*", 3, 4), None)), f)
+        assert _disk_cache_load(source) is None
+
+    def test_corrupt_entry_falls_back_to_miss(self, cache_dir):
+        import hashlib
+        from models.skills.sexpr_generator import _disk_cache_load
+        source = "(- 9 5)"
+        path = cache_dir / (
+            hashlib.sha1(source.encode()).hexdigest() + ".pkl"
+        )
+        path.write_bytes(b"not a pickle")
+        assert _disk_cache_load(source) is None
+
+
+# =============================================================================
+# Test 15: Batch State Arrays (numpy-gated)
+# =============================================================================
+
+
+class TestBatchStateArrays:
+    """Test the SoA batch layout against the scalar fused pass."""
+
+    @pytest.fixture
+    def batch_state(self):
+        pytest.importorskip("numpy")
+        from models.skills.skill_state_arrays import BatchProjectState
+        state = BatchProjectState(3)
+        state.simple[:] = (10, 0, 7)
+        state.medium[:] = (5, 0, 3)
+        state.complex[:] = (2, 0, 1)
+        state.automation_pct[:] = (20.0, 0.0, 50.0)
+        state.activity_days[:] = (5.0, 0.0, 2.5)
+        return state
+
+    def test_batch_totals_match_scalar(self, batch_state):
+        assert list(batch_state.total_files()) == [17, 0, 11]
+
+    def test_run_all_batch_matches_scalar_run_all(self, batch_state):
+        from models.skills.skill_state_arrays import run_all_batch
+        batch = run_all_batch(batch_state)
+        for i in range(3):
+            scalar = run_all(
+                batch_state.simple[i],
+                batch_state.medium[i],
+                batch_state.complex[i],
+                automation_pct=batch_state.automation_pct[i],
+                activity_total=batch_state.activity_days[i],
+            )
+            for channel, expected in zip(batch, scalar):
+                assert channel[i] == pytest.approx(expected)
+
+    def test_packed_scope_total_matches_field_sum(self):
+        pytest.importorskip("numpy")
+        from models.skills.skill_state_arrays import (
+            project_scope_array,
+            total_files_packed,
+        )
+        scope = project_scope_array(2)
+        scope["simple"] = (10, 1)
+        scope["medium"] = (5, 2)
+        scope["complex"] = (2, 3)
+        assert list(total_files_packed(scope)) == [17, 6]
+
+    def test_quantized_buffer_matches_float_floor(self):
+        np = pytest.importorskip("numpy")
+        from models.skills.skill_state_arrays import (
+            buffer_days_quantized,
+            quantize_pcts,
+        )
+        base = np.array([100, 17, 0], dtype=np.int32)
+        leave = quantize_pcts(np.array([10.0, 10.0, 10.0]))
+        dep = quantize_pcts(np.array([15.0, 15.0, 15.0]))
+        learn = quantize_pcts(np.array([20.0, 20.0, 20.0]))
+        assert leave.dtype == np.int8
+        quantized = buffer_days_quantized(base, leave, dep, learn)
+        expected = np.floor(base * 0.45).astype(np.int32)
+        assert list(quantized) == list(expected)